@@ -1,2 +1,2 @@
 @echo off
-python -m pytest tests/e2e/ -v
+python -m pytest tests/e2e/ -v --runslow -n auto --dist loadgroup
@@ -0,0 +1,75 @@
+"""
+Shared pytest configuration for all test suites.
+
+Registers the --runslow option and the slow/network skips used by every suite.
+"""
+
+import functools
+import socket
+import threading
+
+import pytest
+
+# Host probed before running tests marked network
+NETWORK_PROBE_ADDRESS = ("accounts.spotify.com", 443)
+# Seconds allowed for each of the DNS lookup and the TCP connect
+NETWORK_PROBE_TIMEOUT = 1
+
+
+def pytest_addoption(parser):
+    """Add the --runslow option for tests marked slow."""
+    parser.addoption(
+        "--runslow",
+        action="store_true",
+        default=False,
+        help="run slow tests (e.g. real Spotify OAuth round-trips)",
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def is_network_available() -> bool:
+    """Check once per session whether the Spotify API can be reached."""
+    # create_connection's timeout does not cover DNS, which can block for much
+    # longer when offline, so resolve in a daemon thread and stop waiting after the timeout
+    resolved = []
+
+    def resolve():
+        try:
+            resolved.extend(socket.getaddrinfo(*NETWORK_PROBE_ADDRESS, type=socket.SOCK_STREAM))
+        except OSError:
+            pass
+
+    resolver = threading.Thread(target=resolve, daemon=True)
+    resolver.start()
+    resolver.join(NETWORK_PROBE_TIMEOUT)
+    if resolver.is_alive() or not resolved:
+        return False
+
+    # Like create_connection, try every resolved address (e.g. IPv4 after an unroutable IPv6)
+    for family, socktype, proto, _, address in resolved:
+        try:
+            with socket.socket(family, socktype, proto) as sock:
+                sock.settimeout(NETWORK_PROBE_TIMEOUT)
+                sock.connect(address)
+                return True
+        except OSError:
+            continue
+    return False
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    """
+    Skip tests marked slow unless --runslow was given, and tests marked network when offline.
+
+    Runs after -m deselection so the network probe only happens when a network test remains.
+    """
+    run_slow = config.getoption("--runslow")
+    skip_slow = pytest.mark.skip(reason="needs --runslow")
+    skip_offline = pytest.mark.skip(reason="offline: cannot reach the Spotify API")
+
+    for item in items:
+        if "slow" in item.keywords and not run_slow:
+            item.add_marker(skip_slow)
+        elif "network" in item.keywords and not is_network_available():
+            item.add_marker(skip_offline)
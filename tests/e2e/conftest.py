@@ -4,29 +4,65 @@ E2E Test Configuration and Fixtures
 Centralized configuration for end-to-end tests.
 """
 
+import copy
+import functools
+import locale
+import re
 import pytest
 import subprocess
 import sys
 import os
-import tempfile
 import shutil
-import sqlite3
+import signal
+import threading
+import traceback
 import psutil
+import yaml
 from pathlib import Path
 
+from click.testing import CliRunner
+
+from fortherekord.config import load_config
+from fortherekord.main import cli
+from fortherekord.rekordbox_library import RekordboxLibrary
+
+E2E_DIR = Path(__file__).parent
+PROJECT_ROOT = E2E_DIR.parent.parent
+TEST_CONFIG_PATH = E2E_DIR / "test-config.yaml"
+
+# CLI output line that marks each event the E2E assertions check for
+OUTPUT_EVENTS = {
+    "rekordbox_loaded": "Loading Rekordbox library",
+    "processor_started": "Processing playlist metadata",
+    "processor_dry_run": "DRY RUN MODE - Previewing track metadata changes",
+    "processor_skipped": "Skipping track processing",
+    "database_saved": "Saving changes to database...",
+    "spotify_authenticated": "Authenticated with Spotify as user:",
+    "spotify_dry_run_complete": "DRY RUN COMPLETE - No changes were made to Spotify",
+}
+
+# Seconds a single CLI run may take; below the 30s test timeout so the harness reports
+# the hang (and kills the CLI) before pytest-timeout ends the test or the whole run
+COMMAND_TIMEOUT = 25
+
+# Optional files copied alongside the database so pyrekordbox sees the same library
+REKORDBOX_DB_SIBLING_FILES = ["masterPlaylists6.xml"]
+
 
 @pytest.fixture(scope="session", autouse=True)
-def backup_rekordbox_database():
+def rekordbox_db_snapshot(request, tmp_path_factory):
     """
-    Session-scoped fixture to backup and restore Rekordbox database.
+    Session-scoped snapshot of the Rekordbox database.
 
     This runs ONCE for the entire E2E test suite:
-    - Before any E2E tests: safety checks and creates backup
-    - After all E2E tests: restores the original database from backup
+    - Before any E2E tests: safety checks, then copies the database into a temp directory
+    - Each test then works on its own copy of the snapshot (see e2e_harness),
+      so the real database is never opened by the CLI under test
+
+    Returns:
+        Path to the snapshot copy of the database
     """
     # Get the database path from config
-    from fortherekord.config import load_config
-
     config = load_config()
     db_path = config.get("rekordbox", {}).get("library_path")
 
@@ -41,16 +77,12 @@ def backup_rekordbox_database():
     # Safety check: Ensure test collection has < 20 tracks
     print("\nRunning safety checks for E2E tests...")
     try:
-        from fortherekord.rekordbox_library import RekordboxLibrary
-        from fortherekord.config import load_config
-
-        # Load test config to get include_playlists
-        test_config = load_test_config()
-        full_config = load_config()
-
-        # Merge test config into full config for safety check
-        if "rekordbox" in test_config:
-            full_config.setdefault("rekordbox", {}).update(test_config["rekordbox"])
+        # Merge test config (include_playlists) into the full config for safety check
+        # (requested only now so a missing database skips before test-config.yaml is read)
+        e2e_test_config = request.getfixturevalue("e2e_test_config")
+        full_config = copy.deepcopy(config)
+        if "rekordbox" in e2e_test_config:
+            full_config.setdefault("rekordbox", {}).update(e2e_test_config["rekordbox"])
 
         library = RekordboxLibrary(full_config)
         collection = library.get_filtered_collection()
@@ -70,117 +102,169 @@ def backup_rekordbox_database():
     except Exception as e:
         pytest.fail(f"E2E test safety check failed: {e}")
 
-    # Create backup
-    backup_path = db_path + ".e2e_backup"
-    print(f"Safety checks passed. Backing up Rekordbox database: {db_path} -> {backup_path}")
-    shutil.copy2(db_path, backup_path)
+    # Create snapshot
+    snapshot_dir = tmp_path_factory.mktemp("rekordbox")
+    print(f"Safety checks passed. Snapshotting Rekordbox database: {db_path} -> {snapshot_dir}")
+    return copy_rekordbox_db(Path(db_path), snapshot_dir)
+
+
+def copy_rekordbox_db(db_path: Path, target_dir: Path) -> Path:
+    """
+    Copy the database file and any sibling files that exist next to it into target_dir.
+
+    Returns:
+        Path to the copied database file
+    """
+    for name in [db_path.name] + REKORDBOX_DB_SIBLING_FILES:
+        if (db_path.parent / name).exists():
+            shutil.copy2(db_path.parent / name, target_dir / name)
+
+    copied_db = target_dir / db_path.name
+    if not copied_db.exists():
+        pytest.fail(f"Failed to copy Rekordbox database {db_path} to {target_dir}")
+    return copied_db
 
-    try:
-        # Run all E2E tests
-        yield
-    finally:
-        # Restore from backup
-        print(f"\nRestoring Rekordbox database: {backup_path} -> {db_path}")
-        shutil.copy2(backup_path, db_path)
 
-        # Clean up backup file
-        if os.path.exists(backup_path):
-            os.remove(backup_path)
-            print(f"Removed backup file: {backup_path}")
+def pytest_collection_modifyitems(items):
+    """
+    Mark every E2E test and give it the 30 second E2E timeout.
+
+    pytest-timeout enforces the limit for the whole test, including the CLI run,
+    so there is a single place where a hung E2E test gets aborted.
+    """
+    for item in items:
+        if E2E_DIR in item.path.parents:
+            item.add_marker(pytest.mark.e2e)
+            item.add_marker(pytest.mark.timeout(30))
 
 
-def pytest_configure(config):
-    """Configure pytest for e2e tests."""
-    # Set timeout for all e2e tests
-    config.option.timeout = 30
+def _decode_output(lines: list[bytes], encoding: str) -> str:
+    """
+    Join captured output lines and decode them in one pass, normalising newlines.
 
+    Bare carriage returns (progress-style output) become newlines too, as they would
+    through a text-mode pipe.
+    """
+    text = b"".join(lines).decode(encoding, errors="replace")
+    return text.replace("\r\n", "\n").replace("\r", "\n")
 
-# Configure E2E test timeout globally for this module
-pytestmark = [pytest.mark.e2e, pytest.mark.timeout(30)]  # All E2E tests get 30 second timeout
 
+def kill_process_group(process: subprocess.Popen):
+    """
+    Kill a CLI started by run_fortherekord_command together with any processes it started.
 
-def run_fortherekord_command(args: list[str], env_vars: dict = None) -> subprocess.CompletedProcess:
+    On POSIX the group first gets SIGABRT, so faulthandler writes the hung CLI's
+    tracebacks to stderr before the group is killed. Windows has no equivalent
+    signal, so the process tree is killed with taskkill straight away.
+    """
+    if sys.platform == "win32":
+        subprocess.run(
+            ["taskkill", "/F", "/T", "/PID", str(process.pid)], capture_output=True, check=False
+        )
+    else:
+        try:
+            os.killpg(process.pid, signal.SIGABRT)
+            process.wait(timeout=2)
+        except (ProcessLookupError, subprocess.TimeoutExpired):
+            pass
+        try:
+            os.killpg(process.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    process.wait()
+
+
+def run_fortherekord_command(
+    args: list[str], env_vars: dict = None, verbose: bool = None, in_process: bool = False
+) -> subprocess.CompletedProcess:
     """
-    Helper function to run fortherekord CLI commands as a subprocess with real-time output.
+    Helper function to run fortherekord CLI commands.
+
+    Runs the CLI as a real `python -m fortherekord` subprocess, as users would run it.
 
     Args:
         args: Command line arguments to pass to fortherekord
         env_vars: Additional environment variables to set
+        verbose: Echo the command output live as it runs (defaults to the
+                 FORTHEREKORD_E2E_VERBOSE=1 environment variable)
+        in_process: Run through Click's CliRunner in this process instead (fast local
+                    runs only, see E2ETestHarness.run)
 
     Returns:
         CompletedProcess with stdout, stderr, and return code
     """
-    cmd = [sys.executable, "-m", "fortherekord"] + args
+    if in_process:
+        return run_fortherekord_in_process(args, env_vars, verbose)
+
+    # -X faulthandler makes the CLI dump every thread's traceback when killed on timeout
+    cmd = [sys.executable, "-X", "faulthandler", "-m", "fortherekord"] + args
 
     # Set up environment with test safety
     env = os.environ.copy()
     if env_vars:
         env.update(env_vars)
 
+    if verbose is None:
+        verbose = os.environ.get("FORTHEREKORD_E2E_VERBOSE") == "1"
+
     print(f"\n=== Running: {' '.join(cmd)} ===")
 
     try:
-        # Use Popen for real-time output streaming
+        # Use Popen for real-time output streaming; output is read as bytes and
+        # decoded once at the end rather than line by line
         process = subprocess.Popen(
             cmd,
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
-            text=True,
-            cwd=Path(__file__).parent.parent.parent,  # Run from project root
+            cwd=PROJECT_ROOT,
             env=env,
-            bufsize=1,  # Line buffered
-            universal_newlines=True,
+            # Own process group, so a hung CLI can be killed with everything it started
+            **(
+                {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+                if sys.platform == "win32"
+                else {"start_new_session": True}
+            ),
         )
+        encoding = locale.getpreferredencoding(False)
 
         stdout_lines = []
         stderr_lines = []
 
         # Read output in real-time
-        import threading
-        import time
-
-        def read_stdout():
-            for line in iter(process.stdout.readline, ""):
-                print(f"STDOUT: {line.rstrip()}")
-                stdout_lines.append(line)
-
-        def read_stderr():
-            for line in iter(process.stderr.readline, ""):
-                print(f"STDERR: {line.rstrip()}")
-                stderr_lines.append(line)
+        def read_stream(stream, lines, label):
+            for line in iter(stream.readline, b""):
+                if verbose:
+                    print(f"{label}: {line.decode(encoding, errors='replace').rstrip()}")
+                lines.append(line)
 
         # Start threads to read output
-        stdout_thread = threading.Thread(target=read_stdout)
-        stderr_thread = threading.Thread(target=read_stderr)
+        stdout_thread = threading.Thread(
+            target=read_stream, args=(process.stdout, stdout_lines, "STDOUT")
+        )
+        stderr_thread = threading.Thread(
+            target=read_stream, args=(process.stderr, stderr_lines, "STDERR")
+        )
         stdout_thread.daemon = True
         stderr_thread.daemon = True
         stdout_thread.start()
         stderr_thread.start()
 
-        # Wait for process to complete with timeout
-        start_time = time.time()
-        timeout = 15
-
-        while process.poll() is None:
-            if time.time() - start_time > timeout:
-                process.terminate()
-                try:
-                    process.wait(timeout=2)
-                except subprocess.TimeoutExpired:
-                    process.kill()
-                    process.wait()
-
-                print("=== E2E TEST TIMEOUT DEBUG INFO ===")
-                print(f"Command: {' '.join(cmd)}")
-                print("Timeout: 15 seconds")
-                print("=== CAPTURED STDOUT ===")
-                print("".join(stdout_lines) or "(no stdout)")
-                print("=== CAPTURED STDERR ===")
-                print("".join(stderr_lines) or "(no stderr)")
-                print("=== END DEBUG INFO ===")
-                pytest.fail("E2E test timed out after 15 seconds")
-
-            time.sleep(0.1)
+        try:
+            process.wait(timeout=COMMAND_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            kill_process_group(process)
+            stdout_thread.join(timeout=1)
+            stderr_thread.join(timeout=1)
+
+            print("=== E2E TEST TIMEOUT DEBUG INFO ===")
+            print(f"Command: {' '.join(cmd)}")
+            print(f"Timeout: {COMMAND_TIMEOUT} seconds")
+            print("=== CAPTURED STDOUT ===")
+            print(_decode_output(stdout_lines, encoding) or "(no stdout)")
+            print("=== CAPTURED STDERR ===")
+            print(_decode_output(stderr_lines, encoding) or "(no stderr)")
+            print("=== END DEBUG INFO ===")
+            pytest.fail(f"E2E test timed out after {COMMAND_TIMEOUT} seconds")
 
         # Wait for threads to finish reading
         stdout_thread.join(timeout=1)
@@ -188,33 +272,70 @@ def run_fortherekord_command(args: list[str], env_vars: dict = None) -> subproce
 
         # Create result object
         result = subprocess.CompletedProcess(
-            cmd, process.returncode, "".join(stdout_lines), "".join(stderr_lines)
+            cmd,
+            process.returncode,
+            _decode_output(stdout_lines, encoding),
+            _decode_output(stderr_lines, encoding),
         )
 
     except Exception as e:
         print(f"Error running command: {e}")
         raise
 
-    # Print output for debugging while still capturing it
-    if result.stdout:
-        print(result.stdout)
-    if result.stderr:
-        print(result.stderr, file=sys.stderr)
-
     return result
 
 
-def load_test_config():
-    """Load test configuration including Spotify credentials and playlist filtering."""
-    import yaml
+def run_fortherekord_in_process(
+    args: list[str], env_vars: dict = None, verbose: bool = None
+) -> subprocess.CompletedProcess:
+    """
+    Run the fortherekord CLI in this process with Click's CliRunner.
 
-    # Load from test-config.yaml in the same directory as conftest.py
-    config_path = Path(__file__).parent / "test-config.yaml"
-    if not config_path.exists():
-        raise FileNotFoundError(f"Test config file not found at {config_path}")
+    Avoids starting a new interpreter and re-importing the application for every test.
+    The environment variables only apply for the duration of the call. Not used for
+    Spotify flows: Spotify authentication leaves its callback listener on port 8888 and
+    its auth thread running in the calling process.
 
-    with open(config_path, "r") as f:
-        config = yaml.safe_load(f)
+    Returns:
+        CompletedProcess with stdout, stderr, and return code, like the subprocess path
+    """
+    if verbose is None:
+        verbose = os.environ.get("FORTHEREKORD_E2E_VERBOSE") == "1"
+
+    print(f"\n=== Running in-process: fortherekord {' '.join(args)} ===")
+
+    try:
+        runner = CliRunner(mix_stderr=False)  # Click < 8.2 mixes stderr in by default
+    except TypeError:
+        runner = CliRunner()  # Click >= 8.2 always keeps stderr separate
+    result = runner.invoke(cli, args, env=env_vars, prog_name="fortherekord")
+
+    stderr = result.stderr
+    if result.exception and not isinstance(result.exception, SystemExit):
+        # A subprocess would have printed the traceback to stderr
+        stderr += "".join(traceback.format_exception(*result.exc_info))
+
+    if verbose:
+        for line in result.stdout.splitlines():
+            print(f"STDOUT: {line}")
+        for line in stderr.splitlines():
+            print(f"STDERR: {line}")
+
+    return subprocess.CompletedProcess(
+        ["fortherekord"] + args, result.exit_code, result.stdout, stderr
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _read_test_config():
+    """Read and validate test-config.yaml once per session."""
+    # Prefer the libyaml loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    try:
+        with open(TEST_CONFIG_PATH, "rb") as f:
+            config = yaml.load(f, Loader=loader)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Test config file not found at {TEST_CONFIG_PATH}") from None
 
     spotify_config = config.get("spotify", {})
     if not spotify_config.get("client_id") or not spotify_config.get("client_secret"):
@@ -223,68 +344,90 @@ def load_test_config():
     return config
 
 
+@functools.lru_cache(maxsize=None)
+def _marker_pattern(markers: tuple) -> re.Pattern:
+    """Compile one alternation regex for a tuple of literal output markers."""
+    return re.compile("|".join(re.escape(marker) for marker in markers))
+
+
+def find_markers(text: str, markers: tuple) -> set:
+    """
+    Scan text once and return which of the literal markers it contains.
+
+    Markers must not overlap each other (e.g. one being a prefix of another),
+    since the scan only reports non-overlapping matches.
+    """
+    return {match.group(0) for match in _marker_pattern(markers).finditer(text)}
+
+
+def load_test_config():
+    """Load test configuration including Spotify credentials and playlist filtering."""
+    # Callers are free to modify the result, so never hand out the cached dict
+    return copy.deepcopy(_read_test_config())
+
+
+def get_default_config(test_config: dict):
+    """Get the default configuration for E2E tests from the loaded test config."""
+    spotify_config = test_config.get("spotify", {})
+    rekordbox_config = test_config.get("rekordbox", {})
+
+    config = {
+        "rekordbox": {},
+        "processor": {
+            "add_key_to_title": True,
+            "add_artist_to_title": True,
+            "remove_artists_in_title": True,
+        },
+        "spotify": {
+            "enabled": True,
+            "client_id": spotify_config["client_id"],
+            "client_secret": spotify_config["client_secret"],
+            "playlist_sync": {"enabled": True},
+        },
+    }
+
+    # Add include_playlists from test config if specified
+    if "include_playlists" in rekordbox_config:
+        config["rekordbox"]["include_playlists"] = rekordbox_config["include_playlists"]
+
+    # Add playlist_prefix from test config if specified
+    if "playlist_prefix" in spotify_config:
+        config["spotify"]["playlist_prefix"] = spotify_config["playlist_prefix"]
+
+    return config
+
+
 class E2ETestHarness:
     """
     Centralized test harness for E2E tests with clean configuration management.
     """
 
-    def __init__(self):
-        # Create temporary dump file for JSON output
-        self._dump_file = tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False)
-        self.rekordbox_db_dump_json_path = self._dump_file.name
-        self._dump_file.close()
+    def __init__(self, work_dir: Path, default_config: dict, library_path: Path):
+        """
+        Args:
+            work_dir: Per-test directory for the config and JSON dump files
+            default_config: Session-wide default config, copied before any overrides
+            library_path: This test's own copy of the Rekordbox database
+        """
+        # Dump file for JSON output, written by the CLI in test mode
+        self.rekordbox_db_dump_json_path = str(work_dir / "rekordbox_dump.json")
 
-        # Create temporary config file
-        self._config_file = tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False)
-        self._config_path = self._config_file.name
-        self._config_file.close()
+        # Config file for this test only
+        self._config_path = str(work_dir / "config.yaml")
 
         # Set up test environment with database safety (disables real database writes)
-        spotify_cache_path = Path(__file__).parent / ".spotify_cache_test"
         self.env_vars = {
             "FORTHEREKORD_TEST_MODE": "1",  # Enable test mode (disables database saves)
             "FORTHEREKORD_TEST_DUMP_FILE": self.rekordbox_db_dump_json_path,
-            "FORTHEREKORD_SPOTIFY_CACHE_PATH": str(spotify_cache_path),
             "FORTHEREKORD_CONFIG_PATH": self._config_path,
         }
 
-        # Initialize with default config
-        self._current_config = self._get_default_config()
+        # Initialize with a private copy of the default config
+        self._current_config = copy.deepcopy(default_config)
+        self._current_config["rekordbox"]["library_path"] = str(library_path)
         self._save_config()
         self._last_result = None
-
-    def _get_default_config(self):
-        """Get the default configuration for E2E tests."""
-        test_config = load_test_config()
-        spotify_config = test_config.get("spotify", {})
-        rekordbox_config = test_config.get("rekordbox", {})
-
-        config = {
-            "rekordbox": {
-                "library_path": "C:/Users/Marcus.Lund/AppData/Roaming/Pioneer/rekordbox/master.db"
-            },
-            "processor": {
-                "add_key_to_title": True,
-                "add_artist_to_title": True,
-                "remove_artists_in_title": True,
-            },
-            "spotify": {
-                "enabled": True,
-                "client_id": spotify_config["client_id"],
-                "client_secret": spotify_config["client_secret"],
-                "playlist_sync": {"enabled": True},
-            },
-        }
-
-        # Add include_playlists from test config if specified
-        if "include_playlists" in rekordbox_config:
-            config["rekordbox"]["include_playlists"] = rekordbox_config["include_playlists"]
-
-        # Add playlist_prefix from test config if specified
-        if "playlist_prefix" in spotify_config:
-            config["spotify"]["playlist_prefix"] = spotify_config["playlist_prefix"]
-
-        return config
+        self.events = set()
 
     def update_config(self, overrides: dict):
         """
@@ -313,40 +456,15 @@ class E2ETestHarness:
 
     def _save_config(self):
         """Save the current configuration to the temporary YAML file."""
-        import yaml
-
-        config_content = yaml.dump(self._current_config, default_flow_style=False)
+        # Prefer the libyaml dumper when PyYAML was built with it
+        dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
         with open(self._config_path, "w") as f:
-            f.write(config_content)
-
-    def read_dump_json(self):
-        """
-        Read and parse the JSON dump file created during test execution.
-
-        Returns:
-            dict or list: The parsed JSON data, or None if file doesn't exist or is empty
-        """
-        if not Path(self.rekordbox_db_dump_json_path).exists():
-            return None
-
-        with open(self.rekordbox_db_dump_json_path, "r") as f:
-            content = f.read().strip()
-            if not content:
-                return None
-
-            import json
-
-            return json.loads(content)
+            yaml.dump(self._current_config, f, Dumper=dumper, default_flow_style=False)
 
     def assert_rekordbox_save(self, expected):
         """Verify that a Rekordbox save operation was attempted as expected."""
-        if self._last_result is None:
-            raise ValueError("Must call run() before using assertions")
-
-        stdout = self._last_result.stdout or ""
-
-        save_messages = ["Saving changes to database..."]
-        actual = any(msg in stdout for msg in save_messages)
+        stdout = self._require_result()
+        actual = "database_saved" in self.events
         if expected:
             # Look for save operation messages - either dry run or actual save attempt
             assert actual, (
@@ -363,6 +481,13 @@ class E2ETestHarness:
         """
         Run the fortherekord application with the test harness environment.
 
+        The CLI runs as a subprocess. Setting FORTHEREKORD_E2E_IN_PROCESS=1 opts into
+        running it in-process for fast local runs, but only when Spotify is not
+        configured, so Spotify flows always get a process of their own.
+
+        The output is scanned once and the matching OUTPUT_EVENTS names are stored in
+        self.events for the assert_* helpers.
+
         Args:
             args: Command line arguments to pass to fortherekord (default: [])
 
@@ -371,9 +496,23 @@ class E2ETestHarness:
         """
         if args is None:
             args = []
-        self._last_result = run_fortherekord_command(args, env_vars=self.env_vars)
+        in_process = (
+            os.environ.get("FORTHEREKORD_E2E_IN_PROCESS") == "1"
+            and "spotify" not in self._current_config
+        )
+        self._last_result = run_fortherekord_command(
+            args, env_vars=self.env_vars, in_process=in_process
+        )
+        found = find_markers(self._last_result.stdout or "", tuple(OUTPUT_EVENTS.values()))
+        self.events = {event for event, marker in OUTPUT_EVENTS.items() if marker in found}
         return self._last_result
 
+    def _require_result(self) -> str:
+        """Return the stdout of the last run, failing if run() has not been called."""
+        if self._last_result is None:
+            raise ValueError("Must call run() before using assertions")
+        return self._last_result.stdout or ""
+
     def assert_process_succeeded(self, expected: bool):
         """
         Assert that the command completed successfully or failed as expected.
@@ -382,8 +521,7 @@ class E2ETestHarness:
             expected: True if command should have succeeded (returncode 0),
                     False if should have failed
         """
-        if self._last_result is None:
-            raise ValueError("Must call run() before using assertions")
+        self._require_result()
 
         actual = self._last_result.returncode == 0
         if expected:
@@ -399,18 +537,12 @@ class E2ETestHarness:
             expected: True if processor should have run, False if disabled
             dry_run: True if running in dry-run mode
         """
-        if self._last_result is None:
-            raise ValueError("Must call run() before using assertions")
-
-        stdout = self._last_result.stdout or ""
+        stdout = self._require_result()
 
         if dry_run and expected:
-            actual = "DRY RUN MODE" in stdout and "Processing playlist metadata" in stdout
+            actual = {"processor_dry_run", "processor_started"} <= self.events
         else:
-            actual = (
-                "Processing playlist metadata" in stdout
-                and "Skipping track processing" not in stdout
-            )
+            actual = "processor_started" in self.events and "processor_skipped" not in self.events
 
         if expected:
             if dry_run:
@@ -429,11 +561,8 @@ class E2ETestHarness:
         Args:
             expected: True if Rekordbox should have loaded successfully, False if should have failed
         """
-        if self._last_result is None:
-            raise ValueError("Must call run() before using assertions")
-
-        stdout = self._last_result.stdout or ""
-        actual = "Loading Rekordbox library" in stdout
+        stdout = self._require_result()
+        actual = "rekordbox_loaded" in self.events
 
         if expected:
             assert (
@@ -453,28 +582,23 @@ class E2ETestHarness:
                      False if should have failed/been skipped
             dry_run: True if running in dry-run mode
         """
-        if self._last_result is None:
-            raise ValueError("Must call run() before using assertions")
-
-        stdout = self._last_result.stdout or ""
-
-        if dry_run and expected:
-            actual = (
-                "DRY RUN MODE - Previewing changes without making them" in stdout
-                or "Authenticated with Spotify as user:" in stdout
-            )
-        else:
-            actual = "Authenticated with Spotify as user:" in stdout
+        stdout = self._require_result()
+        actual = "spotify_authenticated" in self.events
 
         if expected:
+            assert (
+                actual
+            ), f"Expected Spotify authentication success, but not found in output: {stdout}"
+            # A dry run must still authenticate, then finish without touching Spotify
+            dry_run_complete = "spotify_dry_run_complete" in self.events
             if dry_run:
                 assert (
-                    actual
-                ), f"Expected Spotify dry run or authentication, but not found in output: {stdout}"
+                    dry_run_complete
+                ), f"Expected Spotify dry run to complete, but not found in output: {stdout}"
             else:
                 assert (
-                    actual
-                ), f"Expected Spotify authentication success, but not found in output: {stdout}"
+                    not dry_run_complete
+                ), f"Expected a real Spotify sync, but it ran as a dry run in output: {stdout}"
         else:
             assert (
                 not actual
@@ -488,16 +612,64 @@ class E2ETestHarness:
             Path(self._config_path).unlink()
 
 
+@pytest.fixture(scope="session")
+def e2e_test_config():
+    """
+    Session-scoped test-config.yaml contents (Spotify credentials, playlist filtering).
+
+    Loaded once for the whole E2E run; treat it as read-only.
+    """
+    return load_test_config()
+
+
+@pytest.fixture(scope="session")
+def e2e_default_config(e2e_test_config):
+    """
+    Session-scoped default E2E configuration, built once from test-config.yaml.
+
+    Harnesses take a deep copy, so per-test overrides never leak between tests.
+    """
+    return get_default_config(e2e_test_config)
+
+
 @pytest.fixture
-def e2e_harness():
+def e2e_harness(tmp_path, e2e_default_config, rekordbox_db_snapshot):
     """
     Pytest fixture that provides a clean, centralized E2E test harness.
 
     Returns:
         E2ETestHarness: Test harness with configuration management and JSON dump handling
     """
-    harness = E2ETestHarness()
+    db_dir = tmp_path / "rekordbox"
+    db_dir.mkdir()
+    library_path = copy_rekordbox_db(rekordbox_db_snapshot, db_dir)
+    harness = E2ETestHarness(tmp_path, e2e_default_config, library_path)
     try:
         yield harness
     finally:
         harness.cleanup()
+
+
+@pytest.fixture
+def spotify_cli_invoker(e2e_harness):
+    """
+    Pytest fixture that runs a Spotify-only sync (processor disabled) through the harness.
+
+    Returns:
+        Callable taking CLI args and optional client_id/client_secret overrides
+        (defaulting to the test-config.yaml credentials); it returns the harness
+        so the assert_* helpers can be used on the run
+    """
+
+    def _invoke(args: list[str] = None, *, client_id: str = None, client_secret: str = None):
+        overrides = {"processor": None}  # Remove processor config to disable it
+        credentials = {"client_id": client_id, "client_secret": client_secret}
+        credentials = {key: value for key, value in credentials.items() if value is not None}
+        if credentials:
+            overrides["spotify"] = credentials
+
+        e2e_harness.update_config(overrides)
+        e2e_harness.run(args)
+        return e2e_harness
+
+    return _invoke
@@ -4,12 +4,6 @@ End-to-end test for ForTheRekord metadata processing workflow.
 Tests the complete metadata processing workflow with database safety mechanisms.
 """
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "tests" / "e2e"))
-from conftest import e2e_harness
-
 
 def test_e2e_process_library(e2e_harness):
     """Test the complete metadata processing workflow with database safety."""
@@ -4,12 +4,6 @@ End-to-end test for ForTheRekord metadata processing workflow in dry run mode.
 Tests the complete metadata processing workflow in dry run mode with database safety mechanisms.
 """
 
-import sys
-from pathlib import Path
-
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "tests" / "e2e"))
-from conftest import e2e_harness
-
 
 def test_e2e_process_library_dry_run(e2e_harness):
     """Test the complete metadata processing workflow in dry run mode."""
@@ -24,4 +18,4 @@ def test_e2e_process_library_dry_run(e2e_harness):
     e2e_harness.assert_rekordbox_loaded(True)
     e2e_harness.assert_processor_ran(True, dry_run=True)
     e2e_harness.assert_spotify_synced(False)
-    e2e_harness.assert_rekordbox_save(False)  # Should still show save attempt in dry run
+    e2e_harness.assert_rekordbox_save(False)  # Dry run previews changes without saving
@@ -2,28 +2,28 @@
 E2E test for Spotify playlist sync when music library processor is disabled.
 
 Tests the workflow where all processor enhancement features are disabled,
-but Spotify sync should still continue to work.
+but Spotify sync should still continue to work, both for a real run and
+with the --dry-run flag previewing the changes.
 """
 
-import sys
-from pathlib import Path
+import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "tests" / "e2e"))
-from conftest import e2e_harness
+# Authenticates against the real Spotify API. Spotify cases share one worker under xdist
+# (--dist loadgroup): every OAuth flow binds the fixed 127.0.0.1:8888 callback port, so two
+# at once would collide, and running them one after another also keeps the suite under
+# Spotify's rate limits
+pytestmark = [pytest.mark.slow, pytest.mark.network, pytest.mark.xdist_group("spotify")]
 
 
-def test_e2e_spotify_sync(e2e_harness):
+@pytest.mark.parametrize("dry_run", [False, True], ids=["sync", "dry_run"])
+def test_e2e_spotify_sync(spotify_cli_invoker, dry_run):
     """Test Spotify playlist sync when music library processor is disabled."""
 
-    # Configure with processor disabled (by omitting processor config)
-    e2e_harness.update_config({"processor": None})  # Remove processor config to disable it
+    # Run with the processor disabled - should handle it gracefully and still sync
+    e2e_harness = spotify_cli_invoker(["--dry-run"] if dry_run else [])
 
-    # Run the command - should handle disabled processor gracefully
-    e2e_harness.run()
-
-    # Should handle the scenario gracefully
     e2e_harness.assert_process_succeeded(True)
     e2e_harness.assert_rekordbox_loaded(True)
     e2e_harness.assert_processor_ran(False)
-    e2e_harness.assert_spotify_synced(True)
+    e2e_harness.assert_spotify_synced(True, dry_run=dry_run)
     e2e_harness.assert_rekordbox_save(False)
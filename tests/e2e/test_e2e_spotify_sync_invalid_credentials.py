@@ -4,31 +4,23 @@ E2E test for Spotify sync with invalid credentials.
 Tests that the application handles invalid Spotify credentials gracefully.
 """
 
-import sys
-from pathlib import Path
+import pytest
 
-sys.path.insert(0, str(Path(__file__).parent.parent.parent / "tests" / "e2e"))
-from conftest import e2e_harness
 
-
-def test_e2e_spotify_sync_invalid_credentials(e2e_harness):
+# Goes through the real Spotify OAuth flow in a CLI subprocess, like test_e2e_spotify_sync.py:
+# the bad credentials only fail once the local OAuth callback on port 8888 and the
+# auth-thread timeout give up, so it is slow and shares that test's worker.
+# The mocked 401 path is covered by test_authentication_invalid_client_error in the unit tests
+@pytest.mark.slow
+@pytest.mark.network
+@pytest.mark.xdist_group("spotify")
+def test_e2e_spotify_sync_invalid_credentials(spotify_cli_invoker):
     """Test Spotify sync when credentials are invalid."""
 
-    # Disable processor (by omitting processor config) and override with invalid Spotify credentials
-    e2e_harness.update_config(
-        {
-            "processor": None,  # Remove processor config to disable it
-            "spotify": {
-                "enabled": True,
-                "client_id": "invalid_client_id_12345",
-                "client_secret": "invalid_client_secret_67890",
-                "playlist_sync": {"enabled": True},
-            },
-        }
-    )
-
     # Run the main command - should fail gracefully with invalid Spotify credentials
-    e2e_harness.run()
+    e2e_harness = spotify_cli_invoker(
+        client_id="invalid_client_id_12345", client_secret="invalid_client_secret_67890"
+    )
 
     # Should fail due to invalid Spotify credentials (but actually succeeds because
     # credentials just aren't configured)
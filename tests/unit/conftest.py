@@ -9,15 +9,23 @@ import pytest
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+import click
+from pyrekordbox import Rekordbox6Database
+
+from fortherekord.main import cli
 from fortherekord.models import Track, Playlist, Collection
+from fortherekord.music_library_processor import MusicLibraryProcessor
+from fortherekord.rekordbox_library import RekordboxLibrary
+from fortherekord.spotify_library import SpotifyLibrary
 
 
 def cleanup_test_dump_file():
     """
     Clean up the test dump file created by save_changes() in test mode.
 
-    This should be called in finally blocks of tests that call save_changes()
-    without overriding the FORTHEREKORD_TEST_DUMP_FILE environment variable.
+    Tests that call save_changes() without overriding the FORTHEREKORD_TEST_DUMP_FILE
+    environment variable should use the isolated_dump_file fixture, which calls this
+    on teardown.
     """
     dump_file = os.getenv("FORTHEREKORD_TEST_DUMP_FILE", "test_changes_dump.json")
     if Path(dump_file).exists():
@@ -27,6 +35,13 @@ def cleanup_test_dump_file():
             pass  # File might be in use or already deleted
 
 
+@pytest.fixture
+def isolated_dump_file():
+    """Remove the test dump file written by save_changes() once the test finishes."""
+    yield
+    cleanup_test_dump_file()
+
+
 @pytest.fixture
 def temp_test_file():
     """
@@ -50,6 +65,13 @@ def temp_test_file():
         pass
 
 
+# Common Test Data
+
+# Minimal configuration that passes load_config's library_path check. Shared across tests,
+# so treat it as read-only and copy it before adding sections.
+VALID_CONFIG = {"rekordbox": {"library_path": "/test/db.edb"}}
+
+
 # Common Test Data Fixtures
 
 
@@ -176,8 +198,6 @@ def create_playlist(
         return playlist
     else:
         # Create actual Playlist model object
-        from fortherekord.models import Playlist
-
         playlist = Playlist(
             id=playlist_id,
             name=name,
@@ -189,8 +209,6 @@ def create_playlist(
 
 def create_collection(playlists: list = None, tracks: list = None):
     """Helper function to create a mock collection from playlists."""
-    from fortherekord.models import Collection
-
     if playlists is None:
         if not (tracks is None):
             playlists = [create_playlist(tracks=tracks)]
@@ -242,6 +260,24 @@ def mock_rekordbox():
     return mock
 
 
+@pytest.fixture
+def mock_rekordbox_db():
+    """Create a mock Rekordbox database connection specced against Rekordbox6Database."""
+    return Mock(spec=Rekordbox6Database)
+
+
+@pytest.fixture
+def mock_library():
+    """Create a mock RekordboxLibrary specced against the real class."""
+    return Mock(spec=RekordboxLibrary)
+
+
+@pytest.fixture
+def mock_processor():
+    """Create a mock MusicLibraryProcessor specced against the real class."""
+    return Mock(spec=MusicLibraryProcessor)
+
+
 @pytest.fixture
 def mock_spotify_client():
     """Create a mock Spotify client for testing."""
@@ -254,8 +290,6 @@ def mock_spotify_client():
         mock_spotify_class.return_value = mock_sp
         mock_sp.current_user.return_value = {"id": "test_user"}
 
-        from fortherekord.spotify_library import SpotifyLibrary
-
         client = SpotifyLibrary("client_id", "client_secret")
 
         return client, mock_sp
@@ -269,6 +303,36 @@ def mock_metadata_processor():
     return mock
 
 
+# Output Fixtures
+
+
+@pytest.fixture
+def echo_mock(monkeypatch):
+    """
+    Replace click.echo with a Mock for the duration of a test.
+
+    Silences output and lets tests assert on call_args_list directly. Don't use it in
+    CliRunner tests, which read the echoed text back from result.output.
+    """
+    mock_echo = Mock()
+    monkeypatch.setattr("fortherekord.main.click.echo", mock_echo)
+    return mock_echo
+
+
+# CLI Fixtures
+
+
+@pytest.fixture(scope="session")
+def help_text():
+    """
+    The CLI's --help text, rendered once per session.
+
+    The help text is static, so it is rendered straight from the command rather than
+    through a CliRunner invocation.
+    """
+    return cli.get_help(click.Context(cli, info_name="fortherekord"))
+
+
 # Common Mock Patterns
 
 
@@ -291,9 +355,15 @@ def create_mock_spotify_search_results(tracks_found=True):
 # Test Utilities
 
 
-def silence_click_echo():
-    """Context manager to silence click.echo calls in tests."""
-    return patch("fortherekord.main.click.echo")
+def echo_contains(mock_echo, needle: str) -> bool:
+    """
+    Check whether a mocked click.echo or print call output the given text.
+
+    The call arguments are joined into one string the way they would have been printed, then
+    searched once.
+    """
+    output = "\n".join(" ".join(str(arg) for arg in call.args) for call in mock_echo.call_args_list)
+    return needle in output
 
 
 def silence_print():
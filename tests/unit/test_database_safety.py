@@ -2,19 +2,31 @@
 CRITICAL: Database Safety Tests - Must Run First
 
 These tests MUST pass before any other tests run to ensure database safety.
-Test file is named with 000_ prefix to ensure it runs first alphabetically.
+unit_test.bat runs this module on its own first, then the rest of the suite in parallel.
 """
 
 import os
 import pytest
 
+from fortherekord.rekordbox_library import RekordboxLibrary
+from .conftest import VALID_CONFIG
+
+
+@pytest.fixture(scope="session")
+def safety_env():
+    """Read the database safety environment variables once per session."""
+    return {
+        "test_mode": os.getenv("FORTHEREKORD_TEST_MODE", ""),
+        "dump_file": os.getenv("FORTHEREKORD_TEST_DUMP_FILE", ""),
+    }
+
 
 class TestDatabaseSafetyFirst:
     """Critical database safety tests that must pass before anything else."""
 
-    def test_000_test_mode_is_enabled(self):
+    def test_000_test_mode_is_enabled(self, safety_env):
         """CRITICAL: Verify test mode is enabled to prevent database commits."""
-        test_mode = os.getenv("FORTHEREKORD_TEST_MODE", "")
+        test_mode = safety_env["test_mode"]
 
         if test_mode != "1":
             pytest.fail(
@@ -22,9 +34,9 @@ class TestDatabaseSafetyFirst:
                 "Database commits are NOT SAFE! Tests must not run without test mode enabled."
             )
 
-    def test_001_test_dump_file_is_configured(self):
+    def test_001_test_dump_file_is_configured(self, safety_env):
         """CRITICAL: Verify test dump file is configured."""
-        dump_file = os.getenv("FORTHEREKORD_TEST_DUMP_FILE", "")
+        dump_file = safety_env["dump_file"]
 
         if not dump_file:
             pytest.fail(
@@ -32,28 +44,21 @@ class TestDatabaseSafetyFirst:
                 "Database safety dump mechanism is not configured!"
             )
 
-    def test_002_database_safety_mechanism_works(self):
+    @pytest.mark.usefixtures("isolated_dump_file")
+    def test_002_database_safety_mechanism_works(self, mock_rekordbox_db):
         """CRITICAL: Verify the database safety mechanism prevents commits."""
-        from unittest.mock import Mock
-        from fortherekord.rekordbox_library import RekordboxLibrary
-        from .conftest import cleanup_test_dump_file
-
         # Test that save_changes never calls commit in test mode
-        mock_db = Mock()
-        library = RekordboxLibrary({"rekordbox": {"library_path": "/test/db.edb"}})
-        library._db = mock_db
-
-        try:
-            # This should NOT call commit due to test mode
-            result = library.save_changes([])
-
-            # Verify it succeeded but never called commit (returns 0 for no tracks)
-            assert result == 0, "save_changes should return 0 for empty track list"
-            mock_db.commit.assert_not_called(), (
-                "CRITICAL: Database commit was called during test mode!"
-            )
-        finally:
-            cleanup_test_dump_file()
+        library = RekordboxLibrary(VALID_CONFIG)
+        library._db = mock_rekordbox_db
+
+        # This should NOT call commit due to test mode
+        result = library.save_changes([])
+
+        # Verify it succeeded but never called commit (returns 0 for no tracks)
+        assert result == 0, "save_changes should return 0 for empty track list"
+        mock_rekordbox_db.commit.assert_not_called(), (
+            "CRITICAL: Database commit was called during test mode!"
+        )
 
 
 # If any of these tests fail, we want to stop immediately
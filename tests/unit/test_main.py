@@ -5,9 +5,12 @@ Tests the individual functions and CLI components.
 """
 
 import pytest
+from pathlib import Path
+from types import SimpleNamespace
 from click.testing import CliRunner
-from unittest.mock import patch, MagicMock, Mock
+from unittest.mock import call, patch, Mock
 
+from fortherekord import __version__
 from fortherekord.main import (
     cli,
     load_config,
@@ -15,14 +18,52 @@ from fortherekord.main import (
     get_collection_to_process,
     process_tracks,
 )
-from .conftest import create_track, create_collection, create_playlist, silence_click_echo
+from fortherekord.playlist_sync import PlaylistSyncService
+from fortherekord.rekordbox_library import RekordboxLibrary
+from fortherekord.spotify_library import SpotifyLibrary
+from .conftest import (
+    VALID_CONFIG,
+    create_track,
+    create_collection,
+    create_playlist,
+    echo_contains,
+)
+
+# One runner serves every invocation; CliRunner keeps no state between invoke() calls
+_RUNNER = CliRunner()
+
+# Names in fortherekord.main that the main_mocks fixture replaces
+MAIN_WORKFLOW = (
+    "load_config",
+    "load_library",
+    "get_collection_to_process",
+    "MusicLibraryProcessor",
+    "process_tracks",
+    "SpotifyLibrary",
+    "PlaylistSyncService",
+)
+
+# Stand-in for a loaded library in CLI tests that only pass it through to other mocks
+_LIBRARY_SENTINEL = object()
 
 
 # Helper functions to reduce repetition
-def run_cli_command(args: list[str]) -> object:
-    """Helper function to run CLI commands and return result."""
-    runner = CliRunner()
-    return runner.invoke(cli, args)
+def run_cli_command(args: list[str], catch_exceptions: bool = False) -> object:
+    """
+    Helper function to run CLI commands and return result.
+
+    Runs Click in non-standalone mode, so Click skips translating the return into sys.exit
+    and deriving the program name. cli() reports its expected errors through click.echo,
+    so unexpected exceptions propagate to the test with their original traceback unless
+    catch_exceptions is set.
+    """
+    return _RUNNER.invoke(
+        cli,
+        args,
+        prog_name="fortherekord",
+        standalone_mode=False,
+        catch_exceptions=catch_exceptions,
+    )
 
 
 def assert_successful_cli_command(result) -> None:
@@ -31,11 +72,31 @@ def assert_successful_cli_command(result) -> None:
     assert result.output is not None
 
 
+def assert_all_in(output: str, *needles: str) -> None:
+    """Helper function to assert every substring appears in one captured output."""
+    missing = [needle for needle in needles if needle not in output]
+    assert not missing, f"missing {missing!r} in output:\n{output}"
+
+
 def assert_failed_cli_command(result, expected_exit_code: int = 1) -> None:
     """Helper function to assert command failed with expected exit code."""
     assert result.exit_code == expected_exit_code
 
 
+@pytest.fixture
+def main_mocks(monkeypatch):
+    """
+    Replace the workflow steps and services used by cli() with Mocks.
+
+    Returns:
+        SimpleNamespace of the mocks, one attribute per name in MAIN_WORKFLOW
+    """
+    mocks = {name: Mock() for name in MAIN_WORKFLOW}
+    for name, mock in mocks.items():
+        monkeypatch.setattr(f"fortherekord.main.{name}", mock)
+    return SimpleNamespace(**mocks)
+
+
 def create_mock_playlist(name: str = "Test Playlist", tracks: list = None, children: list = None):
     """Helper function to create a mock playlist for main.py testing with display_tree method."""
     if tracks is None:
@@ -43,11 +104,10 @@ def create_mock_playlist(name: str = "Test Playlist", tracks: list = None, child
     if children is None:
         children = []
 
-    mock_playlist = Mock()
+    mock_playlist = Mock(spec=["name", "tracks", "children", "display_tree"])
     mock_playlist.name = name
     mock_playlist.tracks = tracks
     mock_playlist.children = children
-    mock_playlist.display_tree = Mock()
     return mock_playlist
 
 
@@ -68,11 +128,7 @@ def create_standard_config(processor_enabled=True, spotify_enabled=True):
 
 
 def setup_standard_cli_mocks(
-    mock_load_config,
-    mock_load_library,
-    mock_get_collection,
-    mock_spotify_class,
-    mock_sync_service_class,
+    main_mocks,
     config=None,
     collection=None,
     spotify_user_id="test_user",
@@ -81,47 +137,71 @@ def setup_standard_cli_mocks(
     # Config setup
     if config is None:
         config = create_standard_config()
-    mock_load_config.return_value = config
+    main_mocks.load_config.return_value = config
 
     # Library setup
-    mock_rekordbox = Mock()
+    mock_rekordbox = Mock(spec=RekordboxLibrary)
     mock_rekordbox.is_rekordbox_running = False
-    mock_load_library.return_value = mock_rekordbox
+    main_mocks.load_library.return_value = mock_rekordbox
 
     # Collection setup
     if collection is None:
         sample_track = create_track()
         mock_playlist = create_mock_playlist("Test Playlist", [sample_track])
         collection = create_collection(playlists=[mock_playlist])
-    mock_get_collection.return_value = collection
+    main_mocks.get_collection_to_process.return_value = collection
 
     # Spotify setup
-    mock_spotify = Mock()
+    mock_spotify = Mock(spec=SpotifyLibrary)
     mock_spotify.user_id = spotify_user_id
     mock_spotify.get_playlists.return_value = []
-    mock_spotify_class.return_value = mock_spotify
+    main_mocks.SpotifyLibrary.return_value = mock_spotify
 
     # Sync service setup
-    mock_sync_service = Mock()
-    mock_sync_service_class.return_value = mock_sync_service
+    mock_sync_service = Mock(spec=PlaylistSyncService)
+    main_mocks.PlaylistSyncService.return_value = mock_sync_service
 
     return mock_rekordbox, mock_spotify, mock_sync_service
 
 
+@pytest.fixture
+def spotify_scenario(main_mocks, sample_track):
+    """
+    Standard CLI workflow with Spotify configured and one single-track playlist.
+
+    Returns:
+        SimpleNamespace with the collection, the library/Spotify/sync mocks and main_mocks,
+        so tests only override the parts that differ
+    """
+    mock_playlist = create_mock_playlist("Test Playlist", [sample_track])
+    collection = create_collection(playlists=[mock_playlist])
+    rekordbox, spotify, sync_service = setup_standard_cli_mocks(main_mocks, collection=collection)
+    return SimpleNamespace(
+        collection=collection,
+        rekordbox=rekordbox,
+        spotify=spotify,
+        sync_service=sync_service,
+        mocks=main_mocks,
+    )
+
+
 class TestCLIBasics:
     """Test basic CLI functionality."""
 
-    def test_cli_help(self):
+    def test_cli_help(self, help_text):
         """Test that help command works."""
-        result = run_cli_command(["--help"])
-        assert_successful_cli_command(result)
-        assert "ForTheRekord" in result.output
-        assert "ForTheRekord - Process Rekordbox track metadata" in result.output
+        assert_all_in(
+            help_text,
+            "Usage: fortherekord",
+            "ForTheRekord - Process Rekordbox track metadata",
+        )
 
-    def test_cli_version(self):
+    def test_cli_version(self, capsys):
         """Test that version command works."""
-        result = run_cli_command(["--version"])
-        assert_successful_cli_command(result)
+        exit_code = cli.main(["--version"], prog_name="fortherekord", standalone_mode=False)
+
+        assert exit_code == 0
+        assert f"fortherekord, version {__version__}" in capsys.readouterr().out
 
     @patch("fortherekord.main.load_config")
     def test_main_command_no_config(self, mock_load_config):
@@ -131,123 +211,121 @@ class TestCLIBasics:
         result = run_cli_command([])
         assert_successful_cli_command(result)  # Should exit gracefully
 
+    @patch("fortherekord.main.process_tracks")
+    @patch("fortherekord.main.MusicLibraryProcessor")
+    @patch("fortherekord.main.get_collection_to_process")
     @patch("fortherekord.main.load_library")
     @patch("fortherekord.main.load_config")
-    def test_main_command_missing_credentials(self, mock_load_config, mock_load_library):
+    def test_main_command_missing_credentials(
+        self,
+        mock_load_config,
+        mock_load_library,
+        mock_get_collection,
+        mock_processor_class,
+        mock_process_tracks,
+        mock_library,
+        mock_processor,
+    ):
         """Test main command with missing Spotify credentials."""
         mock_load_config.return_value = {"rekordbox": {"library_path": "/test/db"}}
         # Mock successful library loading so we get to the Spotify credentials check
-        mock_rekordbox = Mock()
-        mock_load_library.return_value = mock_rekordbox
+        mock_load_library.return_value = mock_library
 
         # Mock the functions that would be called during processing
-        with (
-            patch("fortherekord.main.get_collection_to_process") as mock_get_collection,
-            patch("fortherekord.main.MusicLibraryProcessor") as mock_processor_class,
-            patch("fortherekord.main.process_tracks"),
-        ):
-            mock_collection = Mock()
-            mock_collection.get_all_tracks = Mock(return_value=[Mock()])
-            mock_get_collection.return_value = mock_collection
-            mock_processor_class.return_value = Mock()
+        mock_collection = Mock()
+        mock_collection.get_all_tracks = Mock(return_value=[Mock()])
+        mock_get_collection.return_value = mock_collection
+        mock_processor_class.return_value = mock_processor
 
-            result = run_cli_command([])
-            assert_successful_cli_command(result)
-            assert "Spotify credentials not configured" in result.output
+        result = run_cli_command([])
+        assert_successful_cli_command(result)
+        assert "Spotify credentials not configured" in result.output
 
 
 class TestLoadConfig:
     """Test load_config function."""
 
-    @patch("fortherekord.main.create_default_config")
-    @patch("fortherekord.main.config_load_config")
-    def test_load_config_missing_library_path(self, mock_load_config, mock_create):
+    def test_load_config_missing_library_path(self, monkeypatch, echo_mock):
         """Test load_config when rekordbox_library_path is missing."""
-        mock_load_config.return_value = {}
+        mock_create = Mock()
+        monkeypatch.setattr("fortherekord.main.config_load_config", lambda: {})
+        monkeypatch.setattr("fortherekord.main.create_default_config", mock_create)
 
-        with patch("fortherekord.main.click.echo") as mock_echo:
-            result = load_config()
+        result = load_config()
 
         assert result is None
         mock_create.assert_called_once()
-        assert mock_echo.call_count == 4  # 4 echo calls for error messages
+        assert echo_mock.call_count == 4  # 4 echo calls for error messages
 
-    @patch("fortherekord.main.config_load_config")
-    def test_load_config_valid(self, mock_load_config):
+    def test_load_config_valid(self, monkeypatch):
         """Test load_config with valid configuration."""
-        expected_config = {"rekordbox": {"library_path": "/test/db.edb"}}
-        mock_load_config.return_value = expected_config
+        monkeypatch.setattr("fortherekord.main.config_load_config", lambda: VALID_CONFIG)
 
         result = load_config()
 
-        assert result == expected_config
+        assert result == VALID_CONFIG
 
 
 class TestLoadLibrary:
     """Test load_library function."""
 
-    @patch("fortherekord.main.RekordboxLibrary")
-    def test_load_library_success(self, mock_rekordbox_class):
+    @pytest.fixture
+    def patched_rekordbox(self, monkeypatch, mock_library):
+        """Make fortherekord.main.RekordboxLibrary construct mock_library."""
+        monkeypatch.setattr("fortherekord.main.RekordboxLibrary", Mock(return_value=mock_library))
+        return mock_library
+
+    @pytest.mark.usefixtures("echo_mock")
+    def test_load_library_success(self, patched_rekordbox):
         """Test successful library loading."""
-        mock_rekordbox = mock_rekordbox_class.return_value
-        mock_rekordbox.is_rekordbox_running = False
+        patched_rekordbox.is_rekordbox_running = False
 
-        config = {"rekordbox": {"library_path": "/test/db.edb"}}
-        with patch("fortherekord.main.click.echo"):
-            result = load_library(config)
+        result = load_library(VALID_CONFIG)
 
-        assert result == mock_rekordbox
-        mock_rekordbox._get_database.assert_called_once()
+        assert result == patched_rekordbox
+        patched_rekordbox._get_database.assert_called_once()
 
-    @patch("fortherekord.main.RekordboxLibrary")
-    def test_load_library_rekordbox_running(self, mock_rekordbox_class):
+    def test_load_library_rekordbox_running(self, patched_rekordbox, echo_mock):
         """Test library loading when Rekordbox is running."""
-        mock_rekordbox = mock_rekordbox_class.return_value
-        mock_rekordbox.is_rekordbox_running = True
+        patched_rekordbox.is_rekordbox_running = True
 
-        config = {"rekordbox": {"library_path": "/test/db.edb"}}
-        with patch("fortherekord.main.click.echo") as mock_echo:
-            with pytest.raises(RuntimeError, match="Rekordbox is currently running"):
-                load_library(config)
+        with pytest.raises(RuntimeError, match="Rekordbox is currently running"):
+            load_library(VALID_CONFIG)
 
-        assert mock_echo.call_count == 1  # Loading message only
+        assert echo_mock.call_count == 1  # Loading message only
 
-    @patch("fortherekord.main.RekordboxLibrary")
-    def test_load_library_rekordbox_running_dry_run(self, mock_rekordbox_class):
+    def test_load_library_rekordbox_running_dry_run(self, patched_rekordbox, echo_mock):
         """Test library loading when Rekordbox is running but in dry-run mode."""
-        mock_rekordbox = mock_rekordbox_class.return_value
-        mock_rekordbox.is_rekordbox_running = True
+        patched_rekordbox.is_rekordbox_running = True
 
-        config = {"rekordbox": {"library_path": "/test/db.edb"}}
-        with patch("fortherekord.main.click.echo") as mock_echo:
-            result = load_library(config, dry_run=True)
+        result = load_library(VALID_CONFIG, dry_run=True)
 
-        assert result == mock_rekordbox
-        mock_rekordbox._get_database.assert_called_once()
+        assert result == patched_rekordbox
+        patched_rekordbox._get_database.assert_called_once()
         # Should get loading message + warning about Rekordbox running
-        assert mock_echo.call_count == 2
-        assert "Note: Rekordbox is running, but continuing in dry-run mode" in str(
-            mock_echo.call_args_list
+        assert echo_mock.call_count == 2
+        assert echo_contains(
+            echo_mock, "Note: Rekordbox is running, but continuing in dry-run mode"
         )
 
 
 class TestGetCollectionToProcess:
     """Test get_collection_to_process function."""
 
-    def test_get_collection_with_tracks(self):
+    def test_get_collection_with_tracks(self, capsys):
         """Test getting collection with tracks including nested playlists."""
-        mock_rekordbox = MagicMock()
-        mock_collection = MagicMock()
-        mock_tracks = [MagicMock(), MagicMock()]
+        mock_rekordbox = Mock(spec=["get_filtered_collection"])
+        mock_collection = Mock(spec=["playlists", "get_all_tracks"])
+        mock_tracks = [object(), object()]
 
         # Create nested playlist structure to test recursive counting
-        child_playlist = create_mock_playlist("Child Playlist", tracks=[MagicMock()])
+        child_playlist = create_mock_playlist("Child Playlist", tracks=[object()])
 
         parent_playlist = create_mock_playlist(
             "Parent Playlist", tracks=[], children=[child_playlist]
         )
 
-        regular_playlist = create_mock_playlist("Regular Playlist", tracks=[MagicMock()])
+        regular_playlist = create_mock_playlist("Regular Playlist", tracks=[object()])
 
         mock_playlists = [parent_playlist, regular_playlist]
 
@@ -255,277 +333,174 @@ class TestGetCollectionToProcess:
         mock_collection.get_all_tracks.return_value = mock_tracks
         mock_rekordbox.get_filtered_collection.return_value = mock_collection
 
-        with patch("fortherekord.main.click.echo"), patch("builtins.print"):
-            collection = get_collection_to_process(mock_rekordbox)
+        collection = get_collection_to_process(mock_rekordbox)
 
         assert collection == mock_collection
+        # Parent folder has no tracks of its own, so only the child and regular playlists count
+        assert "Loaded 2 playlist(s) with 2 tracks:" in capsys.readouterr().out
         mock_rekordbox.get_filtered_collection.assert_called_once_with()
         mock_collection.get_all_tracks.assert_called_once()
-        # Verify display_tree was called on each playlist
-        for playlist in mock_playlists:
-            playlist.display_tree.assert_called_once_with(1)
+        # Verify display_tree was called exactly once with depth 1 on each top-level playlist
+        display_calls = [playlist.display_tree.call_args_list for playlist in mock_playlists]
+        assert display_calls == [[call(1)]] * len(mock_playlists)
 
 
 class TestProcessTracks:
     """Test process_tracks function."""
 
-    def test_process_tracks_success(self):
-        """Test successful track processing."""
-        # Create test tracks using utility
-        original_track = create_track()
-
-        # Setup mocks
-        mock_rekordbox = MagicMock()
-        mock_processor = MagicMock()
-
-        mock_rekordbox.update_track_metadata.return_value = True
-        mock_rekordbox.save_changes.return_value = 1  # Return count of saved tracks
+    @pytest.mark.parametrize(
+        "saved_count,expected_message",
+        [(1, "Successfully updated 1 tracks"), (0, "No changes needed")],
+        ids=["tracks_saved", "no_changes"],
+    )
+    def test_process_tracks(
+        self,
+        sample_track,
+        mock_library,
+        mock_processor,
+        echo_mock,
+        saved_count,
+        expected_message,
+    ):
+        """Test track processing saves the changed tracks and reports the saved count."""
+        mock_library.save_changes.return_value = saved_count
 
         # Create a mock collection with the track
-        mock_collection = create_collection(tracks=[original_track])
+        mock_collection = create_collection(tracks=[sample_track])
 
-        with silence_click_echo():
-            process_tracks(mock_collection, mock_rekordbox, mock_processor)
+        process_tracks(mock_collection, mock_library, mock_processor)
 
         # Verify calls
-        mock_processor.process_track.assert_called()
-        mock_rekordbox.save_changes.assert_called_once()
+        mock_processor.process_track.assert_called_once_with(sample_track)
+        mock_library.save_changes.assert_called_once_with(mock_collection.get_changed_tracks())
         # update_track_metadata should NOT be called from process_tracks anymore
-        mock_rekordbox.update_track_metadata.assert_not_called()
-
-    def test_process_tracks_no_changes(self):
-        """Test track processing when no changes are needed."""
-
-        # Setup mocks
-        mock_rekordbox = MagicMock()
-        mock_processor = MagicMock()
-
-        mock_rekordbox.save_changes.return_value = 0  # No tracks were modified
-
-        # Create a mock collection with no changed tracks
-        mock_collection = create_collection(tracks=[create_track()])
-        with silence_click_echo():
-            process_tracks(mock_collection, mock_rekordbox, mock_processor)
-
-        # Verify save_changes was called (but returned 0)
-        mock_rekordbox.save_changes.assert_called_once()
-        mock_rekordbox.update_track_metadata.assert_not_called()
-
-    def test_process_tracks_update_failure(self):
-        """Test track processing when update fails."""
-        # enhanced_track not used since we're testing in-place modification
-
-        # Setup mocks
-        mock_rekordbox = MagicMock()
-        mock_processor = MagicMock()
-
-        mock_rekordbox.save_changes.return_value = 0  # No tracks saved due to failure
-
-        # Create mock collection
-        mock_collection = create_collection(tracks=[create_track()])
-
-        with silence_click_echo():
-            process_tracks(mock_collection, mock_rekordbox, mock_processor)
-
-    def test_process_tracks_save_failure(self):
-        """Test track processing when save fails."""
-
-        # Setup mocks
-        mock_rekordbox = MagicMock()
-        mock_processor = MagicMock()
-
-        mock_rekordbox.save_changes.return_value = 0  # Save returns 0 (no tracks saved)
-
-        # Create mock collection
-        mock_collection = create_collection(tracks=[create_track()])
-
-        with silence_click_echo():
-            process_tracks(mock_collection, mock_rekordbox, mock_processor)
+        mock_library.update_track_metadata.assert_not_called()
+        assert echo_contains(echo_mock, expected_message)
 
-    def test_process_tracks_dry_run_with_changes(self):
+    def test_process_tracks_dry_run_with_changes(
+        self, sample_track, mock_library, mock_processor, echo_mock
+    ):
         """Test track processing in dry-run mode with changes."""
-
-        # Setup mocks - in dry run mode, save_changes should NOT be called
-        mock_rekordbox = Mock()
-        mock_processor = Mock()
-
         # Create mock collection with tracks that have changes
-        track_with_changes = create_track()
-        mock_collection = create_collection(tracks=[track_with_changes])
+        mock_collection = create_collection(tracks=[sample_track])
         # Ensure get_changed_tracks returns the track (indicating it has changes)
-        mock_collection.get_changed_tracks = Mock(return_value=[track_with_changes])
+        mock_collection.get_changed_tracks = Mock(return_value=[sample_track])
 
-        with silence_click_echo():
-            process_tracks(mock_collection, mock_rekordbox, mock_processor, dry_run=True)
+        process_tracks(mock_collection, mock_library, mock_processor, dry_run=True)
 
         # Verify save_changes was NOT called in dry-run mode
-        mock_rekordbox.save_changes.assert_not_called()
+        mock_library.save_changes.assert_not_called()
+        assert echo_contains(echo_mock, "Would update 1 tracks")
 
-    def test_process_tracks_dry_run_no_changes(self):
+    def test_process_tracks_dry_run_no_changes(
+        self, sample_track, mock_library, mock_processor, echo_mock
+    ):
         """Test track processing in dry-run mode when no changes are needed."""
-        # Setup mocks
-        mock_rekordbox = Mock()
-        mock_processor = Mock()
-
         # Create a mock collection with no changed tracks
-        mock_collection = create_collection(tracks=[create_track()])
+        mock_collection = create_collection(tracks=[sample_track])
         # Override get_changed_tracks to return empty list (no changes)
         mock_collection.get_changed_tracks = Mock(return_value=[])
 
-        with silence_click_echo():
-            process_tracks(mock_collection, mock_rekordbox, mock_processor, dry_run=True)
+        process_tracks(mock_collection, mock_library, mock_processor, dry_run=True)
 
         # Verify save_changes was NOT called in dry-run mode
-        mock_rekordbox.save_changes.assert_not_called()
+        mock_library.save_changes.assert_not_called()
+        assert echo_contains(echo_mock, "No changes needed")
 
 
 class TestCLIIntegration:
     """Test CLI integration with error handling."""
 
-    @patch("fortherekord.main.create_default_config")
-    @patch("fortherekord.main.config_load_config")
-    def test_cli_no_config(self, mock_load_config, mock_create_default):
+    def test_cli_no_config(self, monkeypatch):
         """Test CLI when config is missing."""
-        mock_load_config.return_value = {}
+        mock_create_default = Mock()
+        monkeypatch.setattr("fortherekord.main.config_load_config", lambda: {})
+        monkeypatch.setattr("fortherekord.main.create_default_config", mock_create_default)
 
         result = run_cli_command([])
         assert_successful_cli_command(result)
         assert "Error: rekordbox library_path not configured" in result.output
         mock_create_default.assert_called_once()
 
-    @patch("fortherekord.main.load_config")
-    @patch("fortherekord.main.load_library")
-    def test_cli_rekordbox_running(self, mock_load_library, mock_load_config):
-        """Test CLI when Rekordbox is running."""
-        mock_load_config.return_value = {"rekordbox": {"library_path": "/test/db.edb"}}
-        mock_load_library.side_effect = RuntimeError("Rekordbox is currently running")
+    @pytest.mark.parametrize(
+        "error,expected_output",
+        [
+            (
+                RuntimeError("Rekordbox is currently running"),
+                "ERROR: Rekordbox is currently running.",
+            ),
+            (FileNotFoundError(), "Error: Rekordbox database not found"),
+            (OSError("Permission denied"), "Error loading Rekordbox library: Permission denied"),
+        ],
+        ids=["rekordbox_running", "file_not_found", "os_error"],
+    )
+    def test_cli_load_library_errors(self, main_mocks, error, expected_output):
+        """Test CLI handles errors raised while loading the Rekordbox library gracefully."""
+        main_mocks.load_config.return_value = VALID_CONFIG
+        main_mocks.load_library.side_effect = error
 
         result = run_cli_command([])
         assert_successful_cli_command(result)  # CLI handles the error gracefully
+        assert expected_output in result.output
+        main_mocks.get_collection_to_process.assert_not_called()
 
-    @patch("fortherekord.main.load_config")
-    @patch("fortherekord.main.load_library")
-    def test_cli_file_not_found(self, mock_load_library, mock_load_config):
-        """Test CLI when database file doesn't exist."""
-        mock_load_config.return_value = {"rekordbox": {"library_path": "/test/db.edb"}}
-        mock_load_library.side_effect = FileNotFoundError()
-
-        result = run_cli_command([])
-        assert_successful_cli_command(result)
-        assert "Error: Rekordbox database not found" in result.output
-
-    @patch("fortherekord.main.load_config")
-    def test_cli_file_not_found_direct(self, mock_load_config):
+    def test_cli_file_not_found_direct(self, monkeypatch):
         """Test CLI when database file doesn't exist - direct path test."""
         # Set up config to point to a non-existent database file
-        mock_load_config.return_value = {"rekordbox": {"library_path": "/nonexistent/path/db.edb"}}
+        config = {"rekordbox": {"library_path": "/nonexistent/path/db.edb"}}
+        monkeypatch.setattr("fortherekord.main.load_config", lambda: config)
 
         result = run_cli_command([])
         assert result.exit_code == 0  # CLI handles the error gracefully
         assert "Error: Rekordbox database not found" in result.output
 
-    @patch("fortherekord.main.process_tracks")
-    @patch("fortherekord.main.get_collection_to_process")
-    @patch("fortherekord.main.MusicLibraryProcessor")
-    @patch("fortherekord.main.load_library")
-    @patch("fortherekord.main.load_config")
-    def test_cli_no_tracks_found(
-        self,
-        mock_load_config,
-        mock_load_library,
-        mock_init_processor,
-        mock_get_collection,
-        mock_process_tracks,
-    ):
+    def test_cli_no_tracks_found(self, main_mocks):
         """Test CLI when no tracks are found to process."""
-        mock_load_config.return_value = {"rekordbox": {"library_path": "/test/db.edb"}}
-        mock_load_library.return_value = Mock()
-        mock_init_processor.return_value = Mock()
-        mock_collection = Mock()
-        mock_collection.get_all_tracks = Mock(return_value=[])  # No tracks found
-        mock_get_collection.return_value = mock_collection
+        main_mocks.load_config.return_value = VALID_CONFIG
+        main_mocks.load_library.return_value = _LIBRARY_SENTINEL
+        main_mocks.MusicLibraryProcessor.return_value = Mock(spec=["set_original_titles"])
+        mock_collection = Mock(spec=["get_all_tracks"])
+        mock_collection.get_all_tracks.return_value = []  # No tracks found
+        main_mocks.get_collection_to_process.return_value = mock_collection
 
         result = run_cli_command([])
+
         assert result.exit_code == 0
         assert "No tracks found to process" in result.output
-        mock_process_tracks.assert_not_called()  # Should not be called when no tracks
+        # Should not be called when no tracks
+        main_mocks.process_tracks.assert_not_called()
 
-    @patch("fortherekord.main.process_tracks")
-    @patch("fortherekord.main.get_collection_to_process")
-    @patch("fortherekord.main.MusicLibraryProcessor")
-    @patch("fortherekord.main.load_library")
-    @patch("fortherekord.main.load_config")
-    def test_cli_successful_processing(
-        self,
-        mock_load_config,
-        mock_load_library,
-        mock_init_processor,
-        mock_get_collection,
-        mock_process_tracks,
-    ):
+    def test_cli_successful_processing(self, main_mocks, mock_processor):
         """Test CLI when tracks are successfully processed."""
-        mock_load_config.return_value = {
+        main_mocks.load_config.return_value = {
             "rekordbox": {"library_path": "/test/db.edb"},
             "processor": {"add_key_to_title": True},  # Add processor config so it gets called
         }
-        mock_rekordbox = Mock()
-        mock_processor = Mock()
-        mock_tracks = [Mock(), Mock()]  # Some tracks to process
-        mock_collection = Mock()
-        mock_collection.get_all_tracks = Mock(return_value=mock_tracks)
+        mock_tracks = [object(), object()]  # Some tracks to process
+        mock_collection = Mock(spec=["get_all_tracks"])
+        mock_collection.get_all_tracks.return_value = mock_tracks
 
-        mock_load_library.return_value = mock_rekordbox
-        mock_init_processor.return_value = mock_processor
-        mock_get_collection.return_value = mock_collection
+        main_mocks.load_library.return_value = _LIBRARY_SENTINEL
+        main_mocks.MusicLibraryProcessor.return_value = mock_processor
+        main_mocks.get_collection_to_process.return_value = mock_collection
 
         result = run_cli_command([])
+
         assert result.exit_code == 0
-        mock_process_tracks.assert_called_once_with(
-            mock_collection, mock_rekordbox, mock_processor, dry_run=False
+        main_mocks.process_tracks.assert_called_once_with(
+            mock_collection, _LIBRARY_SENTINEL, mock_processor, dry_run=False
         )
 
-    @patch("fortherekord.main.load_config")
-    @patch("fortherekord.main.load_library")
-    def test_cli_os_error(self, mock_load_library, mock_load_config):
-        """Test CLI when OS error occurs."""
-        mock_load_config.return_value = {"rekordbox": {"library_path": "/test/db.edb"}}
-        mock_load_library.side_effect = OSError("Permission denied")
-
-        result = run_cli_command([])
-        assert_successful_cli_command(result)
-        assert "Error loading Rekordbox library: Permission denied" in result.output
-
-    @patch("fortherekord.main.load_config")
-    @patch("fortherekord.main.load_library")
-    @patch("fortherekord.main.SpotifyLibrary")
-    @patch("fortherekord.main.PlaylistSyncService")
-    @patch("fortherekord.main.get_collection_to_process")
-    @patch("fortherekord.main.MusicLibraryProcessor")
-    @patch("fortherekord.main.process_tracks")
-    def test_cli_successful_spotify_sync(
-        self,
-        mock_process_tracks,
-        mock_processor_class,
-        mock_get_collection,
-        mock_sync_service_class,
-        mock_spotify_class,
-        mock_load_library,
-        mock_load_config,
-    ):
+    def test_cli_successful_spotify_sync(self, main_mocks, sample_track):
         """Test CLI with successful Spotify sync workflow."""
         # Create test collection with multiple playlists
-        sample_track = create_track()
         mock_playlist1 = create_mock_playlist("Test Playlist 1", [])
         mock_playlist2 = create_mock_playlist("Test Playlist 2", [sample_track])
         collection = create_collection(playlists=[mock_playlist1, mock_playlist2])
 
         # Setup standard mocks
         mock_rekordbox, mock_spotify, mock_sync_service = setup_standard_cli_mocks(
-            mock_load_config,
-            mock_load_library,
-            mock_get_collection,
-            mock_spotify_class,
-            mock_sync_service_class,
+            main_mocks,
             collection=collection,
         )
 
@@ -534,132 +509,65 @@ class TestCLIIntegration:
 
         # Verify the workflow
         config = create_standard_config()
-        mock_spotify_class.assert_called_once_with("test_client_id", "test_client_secret", config)
-        mock_sync_service_class.assert_called_once_with(mock_rekordbox, mock_spotify, config)
+        main_mocks.SpotifyLibrary.assert_called_once_with(
+            "test_client_id", "test_client_secret", config
+        )
+        main_mocks.PlaylistSyncService.assert_called_once_with(mock_rekordbox, mock_spotify, config)
         mock_sync_service.sync_collection.assert_called_once_with(
             collection, dry_run=False, interactive=False
         )
 
         # Verify process_tracks was called with dry_run=False
-        mock_process_tracks.assert_called_once_with(
-            collection, mock_rekordbox, mock_processor_class.return_value, dry_run=False
+        main_mocks.process_tracks.assert_called_once_with(
+            collection, mock_rekordbox, main_mocks.MusicLibraryProcessor.return_value, dry_run=False
         )
 
         # Check output messages
-        assert "Authenticated with Spotify as user: test_user" in result.output
-        assert "Found 2 Rekordbox playlists to sync" in result.output
-        assert "Spotify playlist sync complete" in result.output
+        assert_all_in(
+            result.output,
+            "Authenticated with Spotify as user: test_user",
+            "Found 2 Rekordbox playlists to sync",
+            "Spotify playlist sync complete",
+        )
 
-    @patch("fortherekord.main.load_config")
-    @patch("fortherekord.main.load_library")
-    @patch("fortherekord.main.SpotifyLibrary")
-    @patch("fortherekord.main.get_collection_to_process")
-    @patch("fortherekord.main.MusicLibraryProcessor")
-    @patch("fortherekord.main.process_tracks")
-    def test_cli_spotify_auth_failure(
-        self,
-        mock_process_tracks,
-        mock_processor_class,
-        mock_get_collection,
-        mock_spotify_class,
-        mock_load_library,
-        mock_load_config,
-    ):
+    def test_cli_spotify_auth_failure(self, spotify_scenario):
         """Test CLI when Spotify authentication fails."""
-        # Create test collection
-        sample_track = create_track()
-        mock_playlist = create_mock_playlist("Test Playlist", [sample_track])
-        collection = create_collection(playlists=[mock_playlist])
-
-        # Setup standard mocks but don't set up sync service since Spotify will fail
-        mock_load_config.return_value = create_standard_config()
-
-        mock_rekordbox = Mock()
-        mock_rekordbox.is_rekordbox_running = False
-        mock_load_library.return_value = mock_rekordbox
-
-        mock_get_collection.return_value = collection
-
         # Mock Spotify authentication failure
-        mock_spotify_class.side_effect = ValueError("Invalid credentials")
+        spotify_scenario.mocks.SpotifyLibrary.side_effect = ValueError("Invalid credentials")
 
         result = run_cli_command([])
         assert result.exit_code == 0  # Should handle error gracefully
 
         # Check error handling
         assert "Failed to authenticate with Spotify: Invalid credentials" in result.output
+        spotify_scenario.mocks.PlaylistSyncService.assert_not_called()
 
-    @patch("fortherekord.main.load_config")
-    @patch("fortherekord.main.load_library")
-    @patch("fortherekord.main.SpotifyLibrary")
-    @patch("fortherekord.main.PlaylistSyncService")
-    @patch("fortherekord.main.get_collection_to_process")
-    @patch("fortherekord.main.MusicLibraryProcessor")
-    @patch("fortherekord.main.process_tracks")
-    def test_cli_dry_run_mode(
-        self,
-        mock_process_tracks,
-        mock_processor_class,
-        mock_get_collection,
-        mock_sync_service_class,
-        mock_spotify_class,
-        mock_load_library,
-        mock_load_config,
-    ):
+    def test_cli_dry_run_mode(self, spotify_scenario):
         """Test CLI with --dry-run flag passes dry_run=True to relevant functions."""
-        # Create test collection
-        sample_track = create_track()
-        mock_playlist = create_mock_playlist("Test Playlist", [sample_track])
-        collection = create_collection(playlists=[mock_playlist])
-
-        # Setup standard mocks
-        mock_rekordbox, mock_spotify, mock_sync_service = setup_standard_cli_mocks(
-            mock_load_config,
-            mock_load_library,
-            mock_get_collection,
-            mock_spotify_class,
-            mock_sync_service_class,
-            collection=collection,
-        )
+        mocks = spotify_scenario.mocks
 
         # Run with --dry-run flag
         result = run_cli_command(["--dry-run"])
         assert_successful_cli_command(result)
 
         # Verify dry_run=True was passed to the right functions
-        mock_process_tracks.assert_called_once_with(
-            collection, mock_rekordbox, mock_processor_class.return_value, dry_run=True
+        mocks.process_tracks.assert_called_once_with(
+            spotify_scenario.collection,
+            spotify_scenario.rekordbox,
+            mocks.MusicLibraryProcessor.return_value,
+            dry_run=True,
         )
-        mock_sync_service.sync_collection.assert_called_once_with(
-            collection, dry_run=True, interactive=False
+        spotify_scenario.sync_service.sync_collection.assert_called_once_with(
+            spotify_scenario.collection, dry_run=True, interactive=False
         )
 
         # The output will show the normal workflow - the key test is that
         # dry_run=True was passed correctly
         assert "Spotify playlist sync complete" in result.output
 
-    @patch("fortherekord.main.PlaylistSyncService")
-    @patch("fortherekord.main.SpotifyLibrary")
-    @patch("fortherekord.main.process_tracks")
-    @patch("fortherekord.main.MusicLibraryProcessor")
-    @patch("fortherekord.main.get_collection_to_process")
-    @patch("fortherekord.main.load_library")
-    @patch("fortherekord.main.load_config")
-    def test_cli_processor_disabled_continues_to_spotify(
-        self,
-        mock_load_config,
-        mock_load_library,
-        mock_get_collection,
-        mock_processor_class,
-        mock_process_tracks,
-        mock_spotify_class,
-        mock_sync_service_class,
-    ):
+    def test_cli_processor_disabled_continues_to_spotify(self, spotify_scenario):
         """Test CLI when processor is disabled but continues to Spotify sync."""
-        # Create test collection
-        sample_track = create_track()
-        mock_playlist = create_mock_playlist("Test Playlist", [sample_track])
-        collection = create_collection(playlists=[mock_playlist])
+        mocks = spotify_scenario.mocks
 
         # Create config without processor settings (which disables it)
         config = create_standard_config(processor_enabled=False)
@@ -667,50 +575,29 @@ class TestCLIIntegration:
             "client_id": "test_id",
             "client_secret": "test_secret",
         }
-
-        # Setup standard mocks
-        mock_rekordbox, mock_spotify, mock_sync_service = setup_standard_cli_mocks(
-            mock_load_config,
-            mock_load_library,
-            mock_get_collection,
-            mock_spotify_class,
-            mock_sync_service_class,
-            config=config,
-            collection=collection,
-        )
+        mocks.load_config.return_value = config
 
         # Mock processor as disabled (returns None)
-        mock_processor_class.return_value = None
+        mocks.MusicLibraryProcessor.return_value = None
 
         result = run_cli_command([])
         assert_successful_cli_command(result)
 
         # Verify process_tracks was NOT called (processor disabled)
-        mock_process_tracks.assert_not_called()
+        mocks.process_tracks.assert_not_called()
 
         # Verify Spotify sync still happened
-        mock_sync_service.sync_collection.assert_called_once_with(
-            collection, dry_run=False, interactive=False
+        spotify_scenario.sync_service.sync_collection.assert_called_once_with(
+            spotify_scenario.collection, dry_run=False, interactive=False
         )
 
-        assert "Skipping track processing (processor is disabled)" in result.output
-        assert "Spotify playlist sync complete" in result.output
+        assert_all_in(
+            result.output,
+            "Skipping track processing (processor is disabled)",
+            "Spotify playlist sync complete",
+        )
 
-    @patch("fortherekord.main.SpotifyLibrary")
-    @patch("fortherekord.main.PlaylistSyncService")
-    @patch("fortherekord.main.process_tracks")
-    @patch("fortherekord.main.get_collection_to_process")
-    @patch("fortherekord.main.load_library")
-    @patch("fortherekord.main.load_config")
-    def test_cli_remap_all_mappings(
-        self,
-        mock_load_config,
-        mock_load_library,
-        mock_get_collection,
-        mock_process_tracks,
-        mock_sync_service_class,
-        mock_spotify_class,
-    ):
+    def test_cli_remap_all_mappings(self, main_mocks):
         """Test CLI with --remap option clears all mappings."""
         # Setup standard mocks with processor disabled
         config = create_standard_config(processor_enabled=False)
@@ -719,11 +606,7 @@ class TestCLIIntegration:
         )
 
         mock_rekordbox, mock_spotify, mock_sync_service = setup_standard_cli_mocks(
-            mock_load_config,
-            mock_load_library,
-            mock_get_collection,
-            mock_spotify_class,
-            mock_sync_service_class,
+            main_mocks,
             config=config,
             collection=collection,
         )
@@ -733,21 +616,7 @@ class TestCLIIntegration:
         assert_successful_cli_command(result)
         mock_sync_service.clear_cache.assert_called_once()
 
-    @patch("fortherekord.main.SpotifyLibrary")
-    @patch("fortherekord.main.PlaylistSyncService")
-    @patch("fortherekord.main.process_tracks")
-    @patch("fortherekord.main.get_collection_to_process")
-    @patch("fortherekord.main.load_library")
-    @patch("fortherekord.main.load_config")
-    def test_cli_remap_specific_algorithm(
-        self,
-        mock_load_config,
-        mock_load_library,
-        mock_get_collection,
-        mock_process_tracks,
-        mock_sync_service_class,
-        mock_spotify_class,
-    ):
+    def test_cli_remap_specific_algorithm(self, main_mocks):
         """Test CLI with --remap basic option clears only basic algorithm mappings."""
         # Setup standard mocks with processor disabled
         config = create_standard_config(processor_enabled=False)
@@ -756,11 +625,7 @@ class TestCLIIntegration:
         )
 
         mock_rekordbox, mock_spotify, mock_sync_service = setup_standard_cli_mocks(
-            mock_load_config,
-            mock_load_library,
-            mock_get_collection,
-            mock_spotify_class,
-            mock_sync_service_class,
+            main_mocks,
             config=config,
             collection=collection,
         )
@@ -778,9 +643,6 @@ class TestUtilityFunctions:
     @patch("os.remove")
     def test_clear_spotify_cache_exception_handling(self, mock_remove, mock_get_cache_path):
         """Test that SpotifyLibrary.clear_cache handles exceptions gracefully."""
-        from fortherekord.spotify_library import SpotifyLibrary
-        from pathlib import Path
-
         # Mock the cache path
         mock_cache_path = Mock(spec=Path)
         mock_cache_path.exists.return_value = True
@@ -799,9 +661,6 @@ class TestUtilityFunctions:
     @patch("os.remove")
     def test_clear_spotify_cache_permission_error(self, mock_remove, mock_get_cache_path):
         """Test that SpotifyLibrary.clear_cache handles PermissionError gracefully."""
-        from fortherekord.spotify_library import SpotifyLibrary
-        from pathlib import Path
-
         # Mock the cache path
         mock_cache_path = Mock(spec=Path)
         mock_cache_path.exists.return_value = True
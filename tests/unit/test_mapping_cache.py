@@ -7,6 +7,7 @@ from pathlib import Path
 from unittest.mock import patch, mock_open
 
 from fortherekord.mapping_cache import MappingCache, MappingEntry
+from .conftest import echo_contains
 
 
 class TestMappingEntry:
@@ -114,7 +115,7 @@ class TestMappingCache:
         cache3 = MappingCache()
         assert cache3.mappings == {}
         assert mock_print.call_count >= 1
-        assert "Warning: Corrupted mapping cache file" in str(mock_print.call_args_list)
+        assert echo_contains(mock_print, "Warning: Corrupted mapping cache file")
 
         # Test 4: Key error (missing fields)
         mock_json_load.side_effect = None
@@ -184,7 +185,7 @@ class TestMappingCache:
             mock_file.side_effect = OSError("Permission denied")
             cache.save_cache()
             assert mock_print.call_count >= 1
-            assert "Warning: Failed to save mapping cache" in str(mock_print.call_args_list)
+            assert echo_contains(mock_print, "Warning: Failed to save mapping cache")
 
     @patch("fortherekord.mapping_cache.get_config_path")
     def test_get_mapping(self, mock_get_config_path):
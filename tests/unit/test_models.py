@@ -4,9 +4,6 @@ Tests for data models.
 Tests the core data structures including playlist hierarchy display.
 """
 
-import io
-from unittest.mock import patch
-
 from fortherekord.models import Collection, Playlist
 from .conftest import create_track
 
@@ -14,7 +11,7 @@ from .conftest import create_track
 class TestPlaylistDisplayTree:
     """Test playlist hierarchy display functionality."""
 
-    def test_display_tree(self, sample_tracks):
+    def test_display_tree(self, sample_tracks, capsys):
         """Test display_tree formats output correctly."""
         # Create children using sample tracks
         child1 = Playlist(
@@ -32,12 +29,8 @@ class TestPlaylistDisplayTree:
         # Create a simple hierarchy
         parent = Playlist(id="parent", name="Parent Playlist", tracks=[], children=[child1, child2])
 
-        # Capture stdout
-        captured_output = io.StringIO()
-        with patch("sys.stdout", captured_output):
-            parent.display_tree()
-
-        output = captured_output.getvalue()
+        parent.display_tree()
+        output = capsys.readouterr().out
 
         # Should format the entire hierarchy correctly
         expected = """- Parent Playlist
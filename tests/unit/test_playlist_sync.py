@@ -7,14 +7,18 @@ Tests the sync logic between Rekordbox and Spotify.
 import pytest
 from unittest.mock import Mock, patch
 
-from fortherekord.playlist_sync import PlaylistSyncService
-from fortherekord.models import Playlist
-from .conftest import create_track, silence_click_echo
+from fortherekord.playlist_sync import PlaylistSyncService, Progress
+from fortherekord.models import Collection, Playlist
+from fortherekord.spotify_library import SpotifyLibrary
+from .conftest import create_track
+
+# Enough track IDs to span two Spotify API batches (100 per request)
+TRACK_IDS_150 = tuple(f"track_{i}" for i in range(150))
 
 
 def create_mock_spotify():
     """Create a mock Spotify library."""
-    return Mock()
+    return Mock(spec=SpotifyLibrary)
 
 
 def create_service_with_config(mock_rekordbox):
@@ -40,12 +44,19 @@ def create_service_with_config(mock_rekordbox):
     return service, spotify.sp
 
 
+@pytest.fixture
+def sync_service(mock_rekordbox):
+    """Provide a configured PlaylistSyncService and its Spotify client mock."""
+    return create_service_with_config(mock_rekordbox)
+
+
 class TestPlaylistSyncService:
 
-    def test_comprehensive_playlist_sync(self, mock_rekordbox):
+    @pytest.mark.usefixtures("echo_mock")
+    def test_comprehensive_playlist_sync(self, sync_service):
         """Test complete playlist sync including deletion,
         name cleaning, exclusion, and creation."""
-        service, sp_mock = create_service_with_config(mock_rekordbox)
+        service, sp_mock = sync_service
         service.exclude_from_playlist_names = ["mytags", "excluded"]
 
         # Mock existing Spotify playlists - one to delete, one to update
@@ -94,12 +105,10 @@ class TestPlaylistSyncService:
         service.spotify.sp.current_user_unfollow_playlist = Mock()
 
         # Test dry-run mode first (covers skip messages)
-        with silence_click_echo():
-            service.sync_collection(collection, dry_run=True)
+        service.sync_collection(collection, dry_run=True)
 
         # Test normal mode
-        with silence_click_echo():
-            service.sync_collection(collection, dry_run=False)
+        service.sync_collection(collection, dry_run=False)
 
         # Should delete playlist with no matches
         service.spotify.sp.current_user_unfollow_playlist.assert_called_with("delete_me_id")
@@ -110,9 +119,10 @@ class TestPlaylistSyncService:
         # Should update existing playlists
         sp_mock.playlist_add_items.assert_called()
 
-    def test_name_cleaning_and_creation(self, mock_rekordbox):
+    @pytest.mark.usefixtures("echo_mock")
+    def test_name_cleaning_and_creation(self, sync_service):
         """Test playlist name cleaning during creation."""
-        service, sp_mock = create_service_with_config(mock_rekordbox)
+        service, sp_mock = sync_service
         # Don't set exclusion terms here - just test the cleaning function directly
 
         # No existing playlists
@@ -127,17 +137,16 @@ class TestPlaylistSyncService:
         service.spotify.search_track.return_value = "spotify_track_id"
         sp_mock.user_playlist_create.return_value = {"id": "new_playlist_id"}
 
-        with silence_click_echo():
-            service.sync_collection(collection)
+        service.sync_collection(collection)
 
         # Should create playlist normally (no cleaning needed)
         sp_mock.user_playlist_create.assert_called_once_with(
             user="test_user", name="test_deep house", public=False
         )
 
-    def test_name_cleaning_functionality(self, mock_rekordbox):
+    def test_name_cleaning_functionality(self, sync_service):
         """Test playlist name cleaning with various scenarios."""
-        service, _ = create_service_with_config(mock_rekordbox)
+        service, _ = sync_service
         service.exclude_from_playlist_names = ["mytags", "test"]
 
         # Test various cleaning scenarios
@@ -148,9 +157,9 @@ class TestPlaylistSyncService:
         assert service._clean_playlist_name("deep house") == "deep house"
         assert service._clean_playlist_name("deep  house   mytags") == "deep house"
 
-    def test_recursive_playlist_collection_and_exclusion(self, mock_rekordbox):
+    def test_recursive_playlist_collection_and_exclusion(self, sync_service):
         """Test recursive playlist collection with filtering and exclusion."""
-        service, _ = create_service_with_config(mock_rekordbox)
+        service, _ = sync_service
         service.exclude_from_playlist_names = ["exclude"]
 
         # Create nested playlist structure
@@ -175,9 +184,10 @@ class TestPlaylistSyncService:
         assert "Child 1" in playlist_names
         assert "Normal Parent" in playlist_names
 
-    def test_comprehensive_dry_run_mode(self, mock_rekordbox, sample_collection):
+    @pytest.mark.usefixtures("echo_mock")
+    def test_comprehensive_dry_run_mode(self, sync_service, sample_collection):
         """Test all dry-run functionality in one comprehensive test."""
-        service, sp_mock = create_service_with_config(mock_rekordbox)
+        service, sp_mock = sync_service
 
         # Mock existing Spotify playlist
         existing_playlist = Mock()
@@ -188,14 +198,13 @@ class TestPlaylistSyncService:
         service.spotify.get_playlist_tracks.return_value = []
         service.spotify.search_track.return_value = "spotify_track_id"
 
-        with silence_click_echo():
-            # Test collection sync in dry-run
-            service.sync_collection(sample_collection, dry_run=True)
+        # Test collection sync in dry-run
+        service.sync_collection(sample_collection, dry_run=True)
 
-            # Test individual methods in dry-run
-            service._create_spotify_playlist("Test Playlist", ["track1"], dry_run=True)
-            service._update_spotify_playlist(existing_playlist, ["track1"], dry_run=True)
-            result = service._find_spotify_matches([create_track("track1")], "", dry_run=True)
+        # Test individual methods in dry-run
+        service._create_spotify_playlist("Test Playlist", ["track1"], dry_run=True)
+        service._update_spotify_playlist(existing_playlist, ["track1"], dry_run=True)
+        result = service._find_spotify_matches([create_track("track1")], "", dry_run=True)
 
         # Verify search still works but no API calls are made
         assert result == ["spotify_track_id"]
@@ -205,9 +214,10 @@ class TestPlaylistSyncService:
         sp_mock.playlist_add_items.assert_not_called()
         sp_mock.playlist_remove_all_occurrences_of_items.assert_not_called()
 
-    def test_playlist_deletion_scenarios(self, mock_rekordbox):
+    @pytest.mark.usefixtures("echo_mock")
+    def test_playlist_deletion_scenarios(self, sync_service):
         """Test playlist deletion in dry-run and normal modes."""
-        service, sp_mock = create_service_with_config(mock_rekordbox)
+        service, sp_mock = sync_service
 
         # Mock existing playlist to delete
         existing_playlist = Mock()
@@ -228,15 +238,13 @@ class TestPlaylistSyncService:
         service.spotify.search_track.return_value = None
         service.spotify.sp.current_user_unfollow_playlist = Mock()
 
-        with silence_click_echo():
-            service.sync_collection(collection, dry_run=True)
+        service.sync_collection(collection, dry_run=True)
 
         # Should not actually delete in dry-run
         service.spotify.sp.current_user_unfollow_playlist.assert_not_called()
 
         # Test actual deletion
-        with silence_click_echo():
-            service.sync_collection(collection, dry_run=False)
+        service.sync_collection(collection, dry_run=False)
 
         # Should delete in normal mode
         service.spotify.sp.current_user_unfollow_playlist.assert_called_once_with("delete_me_id")
@@ -252,12 +260,12 @@ class TestPlaylistSyncService:
         service.spotify.search_track.return_value = None  # No matches
 
         with pytest.raises(RuntimeError, match="Spotify client not authenticated"):
-            with silence_click_echo():
-                service.sync_collection(collection, dry_run=False)
+            service.sync_collection(collection, dry_run=False)
 
-    def test_track_matching_detailed_output(self, mock_rekordbox):
+    @pytest.mark.usefixtures("echo_mock")
+    def test_track_matching_detailed_output(self, sync_service):
         """Test track matching with detailed error output for non-dry-run and small playlists."""
-        service, _ = create_service_with_config(mock_rekordbox)
+        service, _ = sync_service
 
         # Test 1: Large playlist (>5 tracks) with progress bar
         large_tracks = []
@@ -275,8 +283,7 @@ class TestPlaylistSyncService:
 
         service.spotify.search_track.side_effect = search_side_effect
 
-        with silence_click_echo():
-            result = service._find_spotify_matches(large_tracks, "", dry_run=False)
+        result = service._find_spotify_matches(large_tracks, "", dry_run=False)
 
         # Should return only matching tracks
         assert len(result) == 2
@@ -302,8 +309,7 @@ class TestPlaylistSyncService:
         service.spotify.search_track.side_effect = small_search_side_effect
 
         # Test with detailed error output (not dry-run) for small playlist
-        with silence_click_echo():
-            result = service._find_spotify_matches(small_tracks, "", dry_run=False)
+        result = service._find_spotify_matches(small_tracks, "", dry_run=False)
 
         # Should return only the matching track
         assert result == ["spotify_small_song_0"]
@@ -312,15 +318,15 @@ class TestPlaylistSyncService:
         service.spotify.search_track.reset_mock()
         service.spotify.search_track.side_effect = small_search_side_effect
 
-        with silence_click_echo():
-            result = service._find_spotify_matches(small_tracks, "", dry_run=True)
+        result = service._find_spotify_matches(small_tracks, "", dry_run=True)
 
         # Should still return only matching tracks
         assert result == ["spotify_small_song_0"]
 
-    def test_spotify_matching_and_batching(self, mock_rekordbox):
+    @pytest.mark.usefixtures("echo_mock")
+    def test_spotify_matching_and_batching(self, sync_service):
         """Test Spotify track matching and batch operations."""
-        service, sp_mock = create_service_with_config(mock_rekordbox)
+        service, sp_mock = sync_service
 
         # Test track matching
         tracks = [
@@ -329,15 +335,13 @@ class TestPlaylistSyncService:
         ]
         service.spotify.search_track.side_effect = ["spotify_id_1", None]
 
-        with silence_click_echo():
-            result = service._find_spotify_matches(tracks, base_line="")
+        result = service._find_spotify_matches(tracks, base_line="")
 
         assert result == ["spotify_id_1"]
         assert service.spotify.search_track.call_count == 2
 
         # Test batch adding (150 tracks = 2 batches)
-        track_ids = [f"track_{i}" for i in range(150)]
-        service._add_tracks_to_playlist("playlist_id", track_ids)
+        service._add_tracks_to_playlist("playlist_id", list(TRACK_IDS_150))
         assert sp_mock.playlist_add_items.call_count == 2
         assert len(sp_mock.playlist_add_items.call_args_list[0][0][1]) == 100
         assert len(sp_mock.playlist_add_items.call_args_list[1][0][1]) == 50
@@ -346,19 +350,19 @@ class TestPlaylistSyncService:
         sp_mock.reset_mock()
 
         # Test batch removal
-        service._remove_tracks_from_playlist("playlist_id", track_ids)
+        service._remove_tracks_from_playlist("playlist_id", list(TRACK_IDS_150))
         assert sp_mock.playlist_remove_all_occurrences_of_items.call_count == 2
 
-    def test_playlist_updates_and_creation(self, mock_rekordbox, sample_collection):
+    @pytest.mark.usefixtures("echo_mock")
+    def test_playlist_updates_and_creation(self, sync_service, sample_collection):
         """Test playlist creation and updating logic."""
-        service, sp_mock = create_service_with_config(mock_rekordbox)
+        service, sp_mock = sync_service
 
         # Test creating new playlist
         sp_mock.user_playlist_create.return_value = {"id": "new_playlist_id"}
         track_ids = ["track_1", "track_2", "track_3"]
 
-        with silence_click_echo():
-            service._create_spotify_playlist("New Playlist", track_ids)
+        service._create_spotify_playlist("New Playlist", track_ids)
 
         sp_mock.user_playlist_create.assert_called_once_with(
             user="test_user", name="New Playlist", public=False
@@ -375,8 +379,7 @@ class TestPlaylistSyncService:
         service.spotify.get_playlist_tracks.return_value = current_tracks
         new_track_ids = ["keep_track", "add_track"]
 
-        with silence_click_echo():
-            service._update_spotify_playlist(existing_playlist, new_track_ids)
+        service._update_spotify_playlist(existing_playlist, new_track_ids)
 
         sp_mock.playlist_remove_all_occurrences_of_items.assert_called_once_with(
             "existing_id", ["remove_track"]
@@ -391,15 +394,14 @@ class TestPlaylistSyncService:
         service.spotify.get_playlists.return_value = [existing_spotify]
         service.spotify.get_playlist_tracks.return_value = []
 
-        with silence_click_echo():
-            service.sync_collection(sample_collection)
+        service.sync_collection(sample_collection)
 
         sp_mock.user_playlist_create.assert_not_called()  # Should update, not create
 
-    def test_initialization_and_configuration(self, mock_rekordbox):
+    def test_initialization_and_configuration(self, mock_rekordbox, sync_service):
         """Test service initialization and configuration validation."""
         # Test successful initialization
-        service, _ = create_service_with_config(mock_rekordbox)
+        service, _ = sync_service
         assert service.rekordbox == mock_rekordbox
         assert service.spotify is not None
         assert service.playlist_prefix == "test_"
@@ -418,27 +420,28 @@ class TestPlaylistSyncService:
 class TestPlaylistSyncServiceErrorConditions:
     """Test error conditions in playlist sync service."""
 
-    def test_authentication_errors(self, mock_rekordbox):
-        """Test all authentication error scenarios."""
-        service, _ = create_service_with_config(mock_rekordbox)
+    @pytest.mark.parametrize(
+        "method,first_arg",
+        [
+            ("_create_spotify_playlist", "Test Playlist"),
+            ("_add_tracks_to_playlist", "playlist_id"),
+            ("_remove_tracks_from_playlist", "playlist_id"),
+        ],
+        ids=["create_playlist", "add_tracks", "remove_tracks"],
+    )
+    def test_authentication_errors(self, sync_service, method, first_arg):
+        """Test Spotify operations fail when the client is not authenticated."""
+        service, _ = sync_service
         service.spotify.sp = None  # Not authenticated
         service.spotify.user_id = None
 
-        # Test playlist creation
         with pytest.raises(RuntimeError, match="Spotify client not authenticated"):
-            service._create_spotify_playlist("Test Playlist", ["track1", "track2"])
+            getattr(service, method)(first_arg, ["track1", "track2"])
 
-        # Test adding tracks
-        with pytest.raises(RuntimeError, match="Spotify client not authenticated"):
-            service._add_tracks_to_playlist("playlist_id", ["track1", "track2"])
-
-        # Test removing tracks
-        with pytest.raises(RuntimeError, match="Spotify client not authenticated"):
-            service._remove_tracks_from_playlist("playlist_id", ["track1", "track2"])
-
-    def test_sync_single_playlist_with_progress(self, mock_rekordbox):
+    @pytest.mark.usefixtures("echo_mock")
+    def test_sync_single_playlist_with_progress(self, sync_service):
         """Test _sync_single_playlist with Progress object."""
-        service, sp_mock = create_service_with_config(mock_rekordbox)
+        service, sp_mock = sync_service
 
         # Create a simple playlist with one track
         playlist = Playlist(id="playlist1", name="test", tracks=[])
@@ -454,20 +457,18 @@ class TestPlaylistSyncServiceErrorConditions:
         spotify_playlists = {}
 
         # Create progress object
-        from fortherekord.playlist_sync import Progress
-
         progress = Progress(1, 2)
 
-        with silence_click_echo():
-            # Call with explicit progress object
-            service._sync_single_playlist(playlist, spotify_playlists, progress, dry_run=True)
+        # Call with explicit progress object
+        service._sync_single_playlist(playlist, spotify_playlists, progress, dry_run=True)
 
         # Verify the search was called
         service.spotify.search_track.assert_called_once_with("Test Song", "Test Artist", False)
 
-    def test_find_spotify_matches_cached_not_found(self, mock_rekordbox):
+    @pytest.mark.usefixtures("echo_mock")
+    def test_find_spotify_matches_cached_not_found(self, sync_service):
         """Test _find_spotify_matches with cached 'not found' entries to cover cache miss."""
-        service, sp_mock = create_service_with_config(mock_rekordbox)
+        service, sp_mock = sync_service
 
         # Create tracks
         track1 = create_track("track1")
@@ -507,8 +508,7 @@ class TestPlaylistSyncServiceErrorConditions:
         # Mock search to return None for track2 (not found)
         service.spotify.search_track.return_value = None
 
-        with silence_click_echo():
-            result = service._find_spotify_matches(tracks, dry_run=True, base_line="test")
+        result = service._find_spotify_matches(tracks, dry_run=True, base_line="test")
 
         # Should only return track1 (from cache), track3 should be skipped due to cached "not found"
         assert result == ["spotify_track1"]
@@ -519,9 +519,10 @@ class TestPlaylistSyncServiceErrorConditions:
         )
 
 
-def test_sync_collection_orphaned_playlist_cleanup(mock_rekordbox):
+@pytest.mark.usefixtures("echo_mock")
+def test_sync_collection_orphaned_playlist_cleanup(sync_service):
     """Test orphaned playlist cleanup functionality."""
-    service, sp_mock = create_service_with_config(mock_rekordbox)
+    service, sp_mock = sync_service
 
     # Create a collection with one playlist
     playlist = Playlist(id="1", name="Existing Playlist", tracks=[])
@@ -540,16 +541,14 @@ def test_sync_collection_orphaned_playlist_cleanup(mock_rekordbox):
     ]
 
     # Test dry run - no actual deletion
-    with silence_click_echo():
-        service.sync_collection(collection, dry_run=True)
+    service.sync_collection(collection, dry_run=True)
     sp_mock.current_user_unfollow_playlist.assert_not_called()
 
     # Test real run - should delete orphaned playlist
     service.spotify.sp = sp_mock
     service.spotify.user_id = "test_user"
 
-    with silence_click_echo():
-        service.sync_collection(collection, dry_run=False)
+    service.sync_collection(collection, dry_run=False)
 
     # Verify both orphaned playlists were deleted
     # (existing_playlist doesn't match any rekordbox playlist)
@@ -562,14 +561,13 @@ def test_sync_collection_orphaned_playlist_cleanup(mock_rekordbox):
     service.spotify.sp = None
     service.spotify.user_id = None
 
-    with silence_click_echo():
-        with pytest.raises(RuntimeError, match="Spotify client not authenticated"):
-            service.sync_collection(collection, dry_run=False)
+    with pytest.raises(RuntimeError, match="Spotify client not authenticated"):
+        service.sync_collection(collection, dry_run=False)
 
 
-def test_interactive_save_command_handling(mock_rekordbox):
+def test_interactive_save_command_handling(sync_service):
     """Test that save command in interactive mode is handled correctly."""
-    service, _ = create_service_with_config(mock_rekordbox)
+    service, _ = sync_service
 
     # Create a track to search
     track = create_track("test_track")
@@ -596,26 +594,25 @@ def test_interactive_save_command_handling(mock_rekordbox):
     assert service.mapping_cache.save_cache.call_count == 2
 
 
+@pytest.mark.usefixtures("echo_mock")
 class TestCacheClearance:
     """Test cache clearing functionality."""
 
-    def test_clear_cache_all_mappings(self, mock_rekordbox):
+    def test_clear_cache_all_mappings(self, sync_service):
         """Test clearing all mappings from cache."""
-        service, _ = create_service_with_config(mock_rekordbox)
+        service, _ = sync_service
         service.mapping_cache.clear_all_mappings.return_value = 5
 
-        with silence_click_echo():
-            service.clear_cache()
+        service.clear_cache()
 
         service.mapping_cache.clear_all_mappings.assert_called_once()
 
-    def test_clear_cache_by_algorithm(self, mock_rekordbox):
+    def test_clear_cache_by_algorithm(self, sync_service):
         """Test clearing mappings by specific algorithm."""
-        service, _ = create_service_with_config(mock_rekordbox)
+        service, _ = sync_service
         service.mapping_cache.clear_mappings_by_algorithm.return_value = 3
 
-        with silence_click_echo():
-            service.clear_cache("fuzzy")
+        service.clear_cache("fuzzy")
 
         service.mapping_cache.clear_mappings_by_algorithm.assert_called_once_with("fuzzy")
 
@@ -623,13 +620,12 @@ class TestCacheClearance:
 class TestInteractiveMode:
     """Test interactive mode functionality."""
 
-    def test_sync_collection_interactive_display(self, mock_rekordbox):
+    @pytest.mark.usefixtures("echo_mock")
+    def test_sync_collection_interactive_display(self, sync_service):
         """Test interactive mode display in sync_collection."""
-        service, sp_mock = create_service_with_config(mock_rekordbox)
+        service, sp_mock = sync_service
 
         # Create a simple collection with one playlist
-        from fortherekord.models import Collection, Playlist
-
         track = create_track("test_track")
         playlist = Playlist("Test Playlist", "PL1", [track])
         collection = Collection.from_playlists([playlist])
@@ -642,8 +638,7 @@ class TestInteractiveMode:
         service.spotify.search_track.return_value = "spotify_track_id"
 
         # Call sync_collection in interactive mode
-        with silence_click_echo():
-            service.sync_collection(collection, dry_run=False, interactive=True)
+        service.sync_collection(collection, dry_run=False, interactive=True)
 
         # Verify that the sync completed (this covers the interactive display code)
         sp_mock.user_playlist_create.assert_called_once()
@@ -1,2 +1,6 @@
 @echo off
-python -m pytest tests/unit -v --tb=long --cov=src/fortherekord --cov-report=html --cov-report=term-missing
+echo Running database safety tests...
+python -m pytest tests/unit/test_database_safety.py -v --tb=long --cov=src/fortherekord --cov-report=
+if errorlevel 1 exit /b 1
+echo Running unit tests...
+python -m pytest tests/unit -v -n auto --dist loadfile --tb=long --ignore=tests/unit/test_database_safety.py --cov=src/fortherekord --cov-append --cov-report=html --cov-report=term-missing